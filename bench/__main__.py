@@ -0,0 +1,166 @@
+import argparse
+import json
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from bench.corpus import CORPORA
+from blocknode import BlockType, block_to_block_type, iter_blocks, page_layering
+from template import Template
+from textnode import text_to_textnodes
+
+TEMPLATE = Path(__file__).resolve().parent.parent / "template.html"
+STAGES = (
+    "markdown_to_blocks",
+    "block_to_block_type",
+    "text_to_textnodes",
+    "page_layering",
+    "to_html",
+    "template_fill",
+    "file_io",
+)
+INLINE_BLOCKS = (
+    BlockType.HEADING,
+    BlockType.PARAGRAPH,
+    BlockType.UNORDERED_LIST,
+    BlockType.ORDERED_LIST,
+)
+
+
+def run_pipeline(pages, template, out_dir, timings=None):
+    clock = time.perf_counter
+
+    def record(stage, start):
+        if timings is not None:
+            timings[stage] += clock() - start
+
+    for name, markdown in pages:
+        start = clock()
+        blocks = list(iter_blocks(markdown.splitlines()))
+        record("markdown_to_blocks", start)
+
+        start = clock()
+        for block in blocks:
+            block_to_block_type(block.text)
+        record("block_to_block_type", start)
+
+        start = clock()
+        for block in blocks:
+            if block.block_type in INLINE_BLOCKS:
+                text_to_textnodes(block.text)
+        record("text_to_textnodes", start)
+
+        start = clock()
+        node = page_layering(blocks)
+        record("page_layering", start)
+
+        start = clock()
+        body = node.to_html()
+        record("to_html", start)
+
+        start = clock()
+        html = template.render({"Title": name, "Content": body})
+        record("template_fill", start)
+
+        start = clock()
+        path = out_dir / f"{name}.html"
+        path.write_text(html)
+        path.read_text()
+        record("file_io", start)
+
+
+def bench_corpus(name, pages, template, repeat):
+    size = sum(len(markdown.encode()) for _, markdown in pages)
+    best = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for _ in range(repeat):
+            timings = dict.fromkeys(STAGES, 0.0)
+            run_pipeline(pages, template, Path(tmp), timings)
+            if best is None or sum(timings.values()) < sum(best.values()):
+                best = timings
+
+        tracemalloc.start()
+        run_pipeline(pages, template, Path(tmp))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    total = sum(best.values())
+    return {
+        "corpus": name,
+        "pages": len(pages),
+        "bytes": size,
+        "seconds": total,
+        "pages_per_second": len(pages) / total,
+        "mb_per_second": size / (1024 * 1024) / total,
+        "peak_memory_bytes": peak,
+        "stages": best,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(result, baseline=None):
+    print(
+        f"{result['corpus']}: {result['pages']} pages, "
+        f"{result['bytes'] / (1024 * 1024):.1f} MB in {result['seconds']:.3f} s, "
+        f"{result['pages_per_second']:.1f} pages/s, "
+        f"{result['mb_per_second']:.2f} MB/s, "
+        f"peak {result['peak_memory_bytes'] / (1024 * 1024):.1f} MB"
+    )
+    for stage, seconds in result["stages"].items():
+        line = f"    {stage:<20} {seconds * 1000:>10.1f} ms"
+        if baseline and baseline["stages"].get(stage):
+            line += f"  ({seconds / baseline['stages'][stage]:.2f}x baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m bench", description="markdown-to-HTML pipeline benchmarks"
+    )
+    parser.add_argument("--corpus", action="append", choices=sorted(CORPORA))
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results from an earlier run")
+    args = parser.parse_args()
+
+    template = Template(TEMPLATE.read_text())
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {r["corpus"]: r for r in json.load(f)["results"]}
+
+    results = []
+    for name in args.corpus or CORPORA:
+        pages = CORPORA[name](args.scale)
+        result = bench_corpus(name, pages, template, args.repeat)
+        print_result(result, baseline.get(name))
+        results.append(result)
+
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "scale": args.scale,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
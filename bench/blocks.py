@@ -0,0 +1,104 @@
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from blocknode import BlockNode, BlockType, iter_blocks
+
+SECTION = """## Section heading
+
+A paragraph with **bold**, _italic_ and a [link](/somewhere) that runs on
+for a couple of lines so that it looks like real prose.
+
+> A quote
+> spanning two lines
+
+* first item
+* second item
+- third item
+
+1. one
+2. two
+3. three
+
+```
+def example():
+    return [i * i for i in range(10)]
+```
+
+"""
+
+CODE_LINE = "    value = compute(value) + offset  # keep going\n"
+
+
+def make_document(size_bytes: int) -> str:
+    parts = []
+    total = 0
+    while total < size_bytes:
+        parts.append(SECTION)
+        parts.append("```\n" + CODE_LINE * 200 + "```\n\n")
+        total += len(SECTION) + len(CODE_LINE) * 200 + 9
+    return "".join(parts)
+
+
+def regex_block_type(block):
+    if re.match(r"^#{1,6} .*$", block):
+        return BlockType.HEADING
+    if re.findall(
+        r"^\s*`{3}(.*?)\n(.*?)^\s*`{3}", block, flags=re.MULTILINE | re.DOTALL
+    ):
+        return BlockType.CODE
+    if re.findall(r"^>.*$", block, flags=re.MULTILINE):
+        return BlockType.QUOTE
+    if re.findall(r"^(\*|-)\s.*$", block, flags=re.MULTILINE):
+        return BlockType.UNORDERED_LIST
+    if re.findall(r"^\d+\.\s.*$", block, flags=re.MULTILINE):
+        return BlockType.ORDERED_LIST
+    return BlockType.PARAGRAPH
+
+
+def split_and_probe(markdown: str):
+    blocks = [l.strip() for l in markdown.split(sep="\n\n") if l]
+    return [BlockNode(block, regex_block_type(block)) for block in blocks]
+
+
+def line_scanner(markdown: str):
+    return list(iter_blocks(markdown.splitlines()))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="block parser benchmark")
+    parser.add_argument("--sizes", default="1,50", help="document sizes in MB")
+    args = parser.parse_args()
+
+    print(
+        f"{'MB':>6} {'split+regex s':>14} {'scanner s':>10} {'file s':>8} {'speedup':>8}"
+    )
+    for size in (float(s) for s in args.sizes.split(",")):
+        markdown = make_document(int(size * 1024 * 1024))
+        old_time, _ = timed(split_and_probe, markdown)
+        new_time, _ = timed(line_scanner, markdown)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".md", delete=False) as f:
+            f.write(markdown)
+        try:
+            with open(f.name) as stream:
+                file_time, _ = timed(lambda: sum(1 for _ in iter_blocks(stream)))
+        finally:
+            os.unlink(f.name)
+
+        print(
+            f"{size:>6g} {old_time:>14.3f} {new_time:>10.3f} {file_time:>8.3f} "
+            f"{old_time / new_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import random
+
+WORDS = (
+    "elves dwarves hobbits wizard ring mountain river forest shadow light "
+    "journey fellowship kingdom ancient song tower road fire star council"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def inline_span(rng: random.Random) -> str:
+    word = rng.choice(WORDS)
+    return rng.choice(
+        (
+            f"**{word}**",
+            f"_{word}_",
+            f"`{word}()`",
+            f"[{word}](/{word})",
+            f"![{word}](/images/{word}.png)",
+            word,
+        )
+    )
+
+
+def page(rng: random.Random, title: str, sections: int) -> str:
+    parts = [f"# {title}", "[< Back Home](/)"]
+    for i in range(sections):
+        parts.append(f"## Section {i}")
+        parts.append(" ".join(sentence(rng) for _ in range(4)))
+        parts.append("> " + sentence(rng))
+        parts.append("\n".join(f"- {sentence(rng, 6)}" for _ in range(4)))
+        parts.append("\n".join(f"{n}. {inline_span(rng)}" for n in range(1, 4)))
+        parts.append("```\n" + "\n".join(sentence(rng) for _ in range(3)) + "\n```")
+    return "\n\n".join(parts) + "\n"
+
+
+def many_small_pages(scale: float = 1.0, seed: int = 1):
+    rng = random.Random(seed)
+    return [(f"small{i}", page(rng, f"Small {i}", 2)) for i in range(int(2000 * scale))]
+
+
+def few_huge_pages(scale: float = 1.0, seed: int = 2):
+    rng = random.Random(seed)
+    return [(f"huge{i}", page(rng, f"Huge {i}", int(4000 * scale))) for i in range(3)]
+
+
+def inline_heavy(scale: float = 1.0, seed: int = 3):
+    rng = random.Random(seed)
+    pages = []
+    for i in range(int(50 * scale) or 1):
+        paragraphs = [" ".join(inline_span(rng) for _ in range(500)) for _ in range(10)]
+        pages.append((f"inline{i}", f"# Inline {i}\n\n" + "\n\n".join(paragraphs)))
+    return pages
+
+
+def deep_lists(scale: float = 1.0, seed: int = 4):
+    rng = random.Random(seed)
+    pages = []
+    for i in range(int(100 * scale) or 1):
+        lists = []
+        for _ in range(10):
+            lists.append(
+                "\n".join(
+                    f"* {inline_span(rng)} {sentence(rng, 5)}" for _ in range(100)
+                )
+            )
+            lists.append("\n".join(f"{n}. {sentence(rng, 5)}" for n in range(1, 101)))
+        pages.append((f"lists{i}", f"# Lists {i}\n\n" + "\n\n".join(lists)))
+    return pages
+
+
+def large_code_blocks(scale: float = 1.0, seed: int = 5):
+    rng = random.Random(seed)
+    pages = []
+    for i in range(int(20 * scale) or 1):
+        code = "\n".join(
+            f"    {rng.choice(WORDS)} = {n} * factor" for n in range(20000)
+        )
+        pages.append((f"code{i}", f"# Code {i}\n\n```\n{code}\n```\n"))
+    return pages
+
+
+CORPORA = {
+    "many_small_pages": many_small_pages,
+    "few_huge_pages": few_huge_pages,
+    "inline_heavy": inline_heavy,
+    "deep_lists": deep_lists,
+    "large_code_blocks": large_code_blocks,
+}
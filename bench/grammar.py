@@ -0,0 +1,126 @@
+import argparse
+import re
+import time
+
+from bench.corpus import CORPORA
+from blocknode import BlockType, block_to_block_type, markdown_to_blocks
+from grammar import grammar
+from textnode import TextTypePatterns, extract_markdown
+
+LEGACY_HEADING_LINE = r"#{1,6} "
+LEGACY_FENCE_LINE = r"\s*`{3}"
+LEGACY_UNORDERED_LIST_LINE = r"[*-]\s"
+LEGACY_ORDERED_LIST_LINE = r"\d+\.\s"
+
+
+def legacy_block_to_block_type(block_of_markdown_text):
+    match block_of_markdown_text:
+        case block_of_markdown_text if re.match(r"^#{1,6} .*$", block_of_markdown_text):
+            return BlockType.HEADING
+        case block_of_markdown_text if re.findall(
+            r"^\s*`{3}(.*?)\n(.*?)^\s*`{3}",
+            block_of_markdown_text,
+            flags=re.MULTILINE | re.DOTALL,
+        ):
+            return BlockType.CODE
+        case block_of_markdown_text if re.findall(
+            r"^>.*$", block_of_markdown_text, flags=re.MULTILINE
+        ):
+            return BlockType.QUOTE
+        case block_of_markdown_text if re.findall(
+            r"^(\*|-)\s.*$", block_of_markdown_text, flags=re.MULTILINE
+        ):
+            return BlockType.UNORDERED_LIST
+        case block_of_markdown_text if re.findall(
+            r"^\d+\.\s.*$", block_of_markdown_text, flags=re.MULTILINE
+        ):
+            return BlockType.ORDERED_LIST
+        case _:
+            return BlockType.PARAGRAPH
+
+
+def legacy_line_kinds(lines):
+    kinds = []
+    for line in lines:
+        if re.match(LEGACY_FENCE_LINE, line):
+            kinds.append("fence")
+        elif re.match(LEGACY_HEADING_LINE, line):
+            kinds.append("heading")
+        elif line.startswith(">"):
+            kinds.append("quote")
+        elif re.match(LEGACY_UNORDERED_LIST_LINE, line):
+            kinds.append("unordered_list")
+        elif re.match(LEGACY_ORDERED_LIST_LINE, line):
+            kinds.append("ordered_list")
+    return kinds
+
+
+def grammar_line_kinds(lines):
+    parser = grammar()
+    kinds = []
+    for line in lines:
+        if parser.is_fence(line):
+            kinds.append("fence")
+        else:
+            kind = parser.line_kind(line)
+            if kind is not None:
+                kinds.append(kind)
+    return kinds
+
+
+def legacy_extract_markdown(pattern, text):
+    return re.findall(pattern, text)
+
+
+def best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="precompiled grammar benchmark")
+    parser.add_argument("--corpus", default="many_small_pages", choices=CORPORA)
+    parser.add_argument("--scale", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    markdown = "\n\n".join(text for _, text in CORPORA[args.corpus](args.scale))
+    blocks = markdown_to_blocks(markdown)
+    lines = markdown.splitlines()
+    patterns = [pattern.value for pattern in TextTypePatterns]
+
+    cases = (
+        (
+            "block_to_block_type",
+            lambda: [legacy_block_to_block_type(block) for block in blocks],
+            lambda: [block_to_block_type(block) for block in blocks],
+        ),
+        (
+            "line classification",
+            lambda: legacy_line_kinds(lines),
+            lambda: grammar_line_kinds(lines),
+        ),
+        (
+            "extract_markdown",
+            lambda: [legacy_extract_markdown(p, b) for b in blocks for p in patterns],
+            lambda: [extract_markdown(p, b) for b in blocks for p in patterns],
+        ),
+    )
+
+    print(f"{len(blocks)} blocks, {len(lines)} lines from {args.corpus}")
+    print(f"{'case':<22} {'regex ms':>10} {'grammar ms':>11} {'speedup':>8}")
+    for name, legacy, current in cases:
+        before = best_of(legacy, args.repeat)
+        after = best_of(current, args.repeat)
+        print(
+            f"{name:<22} {before * 1000:>10.2f} {after * 1000:>11.2f} "
+            f"{before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
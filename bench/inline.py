@@ -0,0 +1,93 @@
+import argparse
+import gc
+import math
+import time
+
+from textnode import (
+    TextNode,
+    TextType,
+    TextTypePatterns,
+    split_nodes,
+    split_nodes_image,
+    split_nodes_link,
+    text_to_textnodes,
+)
+
+CORPORA = {
+    "mixed": (
+        "Some **bold words** then _an aside_ with `code()` and a [link](/page) ",
+        4,
+    ),
+    "dense": ("**b** ", 1),
+    "brackets": ("[a](", 1),
+}
+
+
+def cascade_text_to_textnodes(text: str):
+    n = split_nodes(
+        [TextNode(text, TextType.TEXT)],
+        "**",
+        TextType.BOLD,
+        TextTypePatterns.BOLD.value,
+    )
+    n = split_nodes(n, "_", TextType.ITALIC, TextTypePatterns.ITALIC.value)
+    n = split_nodes(n, "`", TextType.CODE, TextTypePatterns.CODE.value)
+    n = split_nodes_image(n)
+    n = split_nodes_link(n)
+    return n
+
+
+def best_of(func, text, repeat):
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(text)
+            best = min(best, time.perf_counter() - start)
+            gc.collect()
+    finally:
+        gc.enable()
+    return best
+
+
+def growth(previous, current, previous_size, size):
+    if previous is None:
+        return ""
+    return f"n^{math.log(current / previous) / math.log(size / previous_size):.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="inline tokenizer benchmark")
+    parser.add_argument("--spans", default="4000,16000,64000,256000")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--corpus", choices=tuple(CORPORA), action="append")
+    args = parser.parse_args()
+
+    print(
+        f"{'corpus':<7} {'spans':>7} {'chars':>9} {'cascade ms':>11} {'growth':>7} "
+        f"{'scanner ms':>11} {'growth':>7} {'speedup':>8}"
+    )
+    for name in args.corpus or CORPORA:
+        span, per_span = CORPORA[name]
+        previous = None
+        for count in (int(c) for c in args.spans.split(",")):
+            paragraph = span * max(1, count // per_span)
+            cascade = best_of(cascade_text_to_textnodes, paragraph, args.repeat)
+            scanner = best_of(text_to_textnodes, paragraph, args.repeat)
+            if previous is None:
+                cascade_growth = scanner_growth = ""
+            else:
+                size, cascade_before, scanner_before = previous
+                cascade_growth = growth(cascade_before, cascade, size, len(paragraph))
+                scanner_growth = growth(scanner_before, scanner, size, len(paragraph))
+            print(
+                f"{name:<7} {count:>7} {len(paragraph):>9} {cascade * 1000:>11.2f} "
+                f"{cascade_growth:>7} {scanner * 1000:>11.2f} {scanner_growth:>7} "
+                f"{cascade / scanner:>7.1f}x"
+            )
+            previous = (len(paragraph), cascade, scanner)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import http.client
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVERS = {
+    "http.server": lambda directory, port: [
+        sys.executable,
+        "-m",
+        "http.server",
+        str(port),
+        "--directory",
+        directory,
+    ],
+    "site serve": lambda directory, port: [
+        sys.executable,
+        str(ROOT / "src" / "cli.py"),
+        "serve",
+        directory,
+        "--port",
+        str(port),
+    ],
+}
+SCENARIOS = {
+    "get": {},
+    "gzip": {"Accept-Encoding": "gzip, br"},
+    "revalidate": {"If-None-Match": None},
+}
+
+
+def site_paths(directory, limit):
+    paths = []
+    for content in os.walk(directory):
+        for name in sorted(content[2]):
+            if name.endswith((".gz", ".br")):
+                continue
+            path = os.path.relpath(os.path.join(content[0], name), directory)
+            paths.append("/" + path.replace(os.sep, "/"))
+    return sorted(paths)[:limit]
+
+
+def wait_for(port, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def client(port, paths, headers, deadline, latencies, errors):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    etags = {}
+    index = 0
+    while time.perf_counter() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        request_headers = dict(headers)
+        if "If-None-Match" in request_headers:
+            request_headers["If-None-Match"] = etags.get(path, '"none"')
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=request_headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors.append(path)
+            connection.close()
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.getheader("ETag"):
+            etags[path] = response.getheader("ETag")
+        if response.will_close:
+            connection.close()
+    connection.close()
+
+
+def load(port, paths, headers, clients, duration):
+    latencies = []
+    errors = []
+    deadline = time.perf_counter() + duration
+    threads = [
+        threading.Thread(
+            target=client, args=(port, paths, headers, deadline, latencies, errors)
+        )
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies.sort()
+    return latencies, errors
+
+
+def percentile(latencies, fraction):
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="requests per second: python -m http.server vs site serve"
+    )
+    parser.add_argument("directory", nargs="?", default="docs")
+    parser.add_argument("--port", type=int, default=8890)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--paths", type=int, default=50)
+    args = parser.parse_args()
+
+    paths = site_paths(args.directory, args.paths)
+    if not paths:
+        parser.error(f"no files in {args.directory}; build the site first")
+
+    print(
+        f"{'server':<12} {'scenario':<11} {'req/s':>9} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'errors':>7}"
+    )
+    for name, command in SERVERS.items():
+        server = subprocess.Popen(
+            command(args.directory, args.port),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_for(args.port)
+            for scenario, headers in SCENARIOS.items():
+                latencies, errors = load(
+                    args.port, paths, headers, args.clients, args.duration
+                )
+                print(
+                    f"{name:<12} {scenario:<11} {len(latencies) / args.duration:>9.0f} "
+                    f"{percentile(latencies, 0.5) * 1000:>8.2f} "
+                    f"{percentile(latencies, 0.99) * 1000:>8.2f} {len(errors):>7}"
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import gc
+import tracemalloc
+
+from arena import NodeArena
+from bench.corpus import few_huge_pages
+from blocknode import markdown_to_html_node
+from leafnode import LeafNode
+from parentnode import ParentNode
+
+
+class DictHTMLNode:
+    def __init__(self, tag=None, value=None, children=None, props=None):
+        self.tag = tag
+        self.value = value
+        self.children = children
+        self.props = props
+
+
+class DictLeafNode(DictHTMLNode):
+    def __init__(self, tag, value, props=None):
+        super().__init__(tag, value, None, props=props)
+
+
+class DictParentNode(DictHTMLNode):
+    def __init__(self, tag, children, props=None):
+        super().__init__(tag, None, children, props=props)
+
+
+def clone(node, leaf_cls, parent_cls):
+    if node.children is None:
+        props = dict(node.props) if node.props else None
+        return leaf_cls(node.tag, node.value, props)
+    children = [clone(child, leaf_cls, parent_cls) for child in node.children]
+    props = dict(node.props) if node.props else None
+    return parent_cls(node.tag, children, props)
+
+
+def build_arena(tree):
+    arena, _ = NodeArena.from_node(tree)
+    arena.text
+    return arena
+
+
+def retained(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="memory per HTML node")
+    parser.add_argument("--scale", type=float, default=0.5)
+    args = parser.parse_args()
+
+    markdown = few_huge_pages(args.scale)[0][1]
+    tree = markdown_to_html_node(markdown)
+    arena, _ = NodeArena.from_node(tree)
+    count = len(arena)
+
+    _, dict_bytes = retained(lambda: clone(tree, DictLeafNode, DictParentNode))
+    _, slot_bytes = retained(lambda: clone(tree, LeafNode, ParentNode))
+    _, arena_bytes = retained(lambda: build_arena(tree))
+    text_bytes = len(arena.text.encode())
+
+    print(f"{count} nodes from a {len(markdown) / 1024:.0f} KB page")
+    print(f"{'layout':<28} {'bytes':>12} {'bytes/node':>11}")
+    for name, size in (
+        ("__dict__ classes (before)", dict_bytes),
+        ("__slots__ classes (after)", slot_bytes),
+        ("arena incl. text buffer", arena_bytes),
+        ("arena excl. text buffer", arena_bytes - text_bytes),
+    ):
+        print(f"{name:<28} {size:>12} {size / count:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
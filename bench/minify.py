@@ -0,0 +1,49 @@
+import argparse
+import gzip
+import time
+
+from bench.corpus import CORPORA
+from blocknode import markdown_to_html_node
+from template import Template
+
+TEMPLATE = "template.html"
+
+
+def render_all(template, trees):
+    start = time.perf_counter()
+    pages = [template.render({"Title": "", "Content": tree}) for tree in trees]
+    return pages, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="minified output size and time")
+    parser.add_argument("--scale", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with open(TEMPLATE, "r") as t:
+        text = t.read()
+    plain = Template(text)
+    minified = Template(text, minify=True)
+
+    print(
+        f"{'corpus':<18} {'plain KB':>10} {'min KB':>10} {'saved':>7} "
+        f"{'gz saved':>9} {'plain ms':>9} {'min ms':>9}"
+    )
+    for name, corpus in CORPORA.items():
+        trees = [markdown_to_html_node(markdown) for _, markdown in corpus(args.scale)]
+        plain_pages, plain_time = render_all(plain, trees)
+        min_pages, min_time = render_all(minified, trees)
+
+        plain_bytes = sum(len(page.encode()) for page in plain_pages)
+        min_bytes = sum(len(page.encode()) for page in min_pages)
+        plain_gz = sum(len(gzip.compress(page.encode())) for page in plain_pages)
+        min_gz = sum(len(gzip.compress(page.encode())) for page in min_pages)
+        print(
+            f"{name:<18} {plain_bytes / 1024:>10.0f} {min_bytes / 1024:>10.0f} "
+            f"{1 - min_bytes / plain_bytes:>7.1%} {1 - min_gz / plain_gz:>9.1%} "
+            f"{plain_time * 1000:>9.1f} {min_time * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+from array import array
+
+from htmlnode import HTMLNode
+
+TAGS = [None]
+TAG_IDS = {None: 0}
+
+
+def tag_id(tag) -> int:
+    index = TAG_IDS.get(tag)
+    if index is None:
+        index = len(TAGS)
+        TAGS.append(tag)
+        TAG_IDS[tag] = index
+    return index
+
+
+class NodeArena:
+    __slots__ = (
+        "tags",
+        "value_starts",
+        "value_lengths",
+        "child_starts",
+        "child_counts",
+        "child_ids",
+        "props",
+        "_chunks",
+        "_length",
+        "_text",
+    )
+
+    def __init__(self):
+        self.tags = array("H")
+        self.value_starts = array("q")
+        self.value_lengths = array("L")
+        self.child_starts = array("L")
+        self.child_counts = array("L")
+        self.child_ids = array("L")
+        self.props = {}
+        self._chunks = []
+        self._length = 0
+        self._text = ""
+
+    def add(self, tag, value=None, children=(), props=None) -> int:
+        index = len(self.tags)
+        self.tags.append(tag_id(tag))
+        if value is None:
+            self.value_starts.append(-1)
+            self.value_lengths.append(0)
+        else:
+            self.value_starts.append(self._length)
+            self.value_lengths.append(len(value))
+            self._chunks.append(value)
+            self._length += len(value)
+        self.child_starts.append(len(self.child_ids))
+        self.child_counts.append(len(children))
+        self.child_ids.extend(children)
+        if props:
+            self.props[index] = props
+        return index
+
+    @classmethod
+    def from_node(cls, node: HTMLNode):
+        arena = cls()
+        stack = [(node, False)]
+        built = []
+        while stack:
+            current, expanded = stack.pop()
+            if current.children is None or expanded:
+                count = len(current.children) if current.children else 0
+                children = built[len(built) - count :] if count else ()
+                index = arena.add(current.tag, current.value, children, current.props)
+                if count:
+                    del built[len(built) - count :]
+                built.append(index)
+                continue
+            stack.append((current, True))
+            stack.extend((child, False) for child in reversed(current.children))
+        return arena, built[0]
+
+    @property
+    def text(self) -> str:
+        if self._chunks:
+            self._text += "".join(self._chunks)
+            self._chunks = []
+        return self._text
+
+    def value(self, index):
+        start = self.value_starts[index]
+        if start < 0:
+            return None
+        return self.text[start : start + self.value_lengths[index]]
+
+    def props_to_html(self, index) -> str:
+        return " " + " ".join(f'{k}="{v}"' for k, v in self.props[index].items())
+
+    def iter_html(self, root=0):
+        stack = [root]
+        while stack:
+            index = stack.pop()
+            if isinstance(index, str):
+                yield index
+                continue
+
+            tag = TAGS[self.tags[index]]
+            value = self.value(index)
+            if value is not None:
+                if tag is None:
+                    yield value
+                elif tag == "a":
+                    yield f"<{tag}{self.props_to_html(index)}>{value}</{tag}>"
+                elif tag == "img":
+                    yield f"<{tag}{self.props_to_html(index)}>"
+                else:
+                    yield f"<{tag}>{value}</{tag}>"
+                continue
+
+            if not tag:
+                raise ValueError
+            props = self.props_to_html(index) if index in self.props else ""
+            yield f"<{tag}{props}>"
+            stack.append(f"</{tag}>")
+            start = self.child_starts[index]
+            stack.extend(
+                reversed(self.child_ids[start : start + self.child_counts[index]])
+            )
+
+    def to_html(self, root=0) -> str:
+        return "".join(self.iter_html(root))
+
+    def write_html(self, stream, root=0):
+        stream.writelines(self.iter_html(root))
+
+    def __len__(self):
+        return len(self.tags)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)} nodes)"
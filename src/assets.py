@@ -0,0 +1,123 @@
+import fcntl
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from manifest import hash_file, remove_output
+
+FICLONE = 0x40049409
+
+
+class AssetSync:
+    def __init__(self):
+        self.files = {}
+        self.copied = []
+        self.skipped = []
+        self.removed = []
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self.copied)} copied, "
+            f"{len(self.skipped)} unchanged, {len(self.removed)} removed)"
+        )
+
+
+def signature(stat: os.stat_result) -> str:
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def is_unchanged(source: Path, dest: Path, checksum=False) -> bool:
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    if (source_stat.st_dev, source_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+        return True
+    if source_stat.st_size != dest_stat.st_size:
+        return False
+    if checksum:
+        return hash_file(source) == hash_file(dest)
+    return source_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+
+def transfer_file(source: Path, dest: Path, link=False):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    dest.unlink(missing_ok=True)
+    if link:
+        try:
+            os.link(source, dest)
+            return
+        except OSError:
+            pass
+
+    with open(source, "rb") as src, open(dest, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            copy_file_range(src, dst)
+    shutil.copymode(source, dest)
+    stat = source.stat()
+    os.utime(dest, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def copy_file_range(src, dst):
+    size = os.fstat(src.fileno()).st_size
+    if hasattr(os, "copy_file_range"):
+        try:
+            copied = 0
+            while copied < size:
+                count = os.copy_file_range(src.fileno(), dst.fileno(), size - copied)
+                if count == 0:
+                    break
+                copied += count
+            if copied == size:
+                return
+        except OSError:
+            pass
+    src.seek(0)
+    dst.seek(0)
+    dst.truncate()
+    shutil.copyfileobj(src, dst)
+
+
+def sync_assets(
+    from_path, dest_path, previous=(), jobs=8, link=False, checksum=False, rename=None
+) -> AssetSync:
+    root = Path(from_path)
+    dest_root = Path(dest_path)
+    result = AssetSync()
+
+    sources = []
+    for content in os.walk(root):
+        (dest_root / Path(content[0]).relative_to(root)).mkdir(
+            parents=True, exist_ok=True
+        )
+        for name in content[2]:
+            source = Path(content[0]) / name
+            key = source.relative_to(root).as_posix()
+            if rename:
+                key = rename.get(key, key)
+            sources.append((key, source))
+
+    def sync(item):
+        key, source = item
+        dest = dest_root / key
+        if is_unchanged(source, dest, checksum):
+            return key, False
+        transfer_file(source, dest, link)
+        return key, True
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for key, copied in executor.map(sync, sources):
+            (result.copied if copied else result.skipped).append(key)
+
+    for key, source in sources:
+        result.files[key] = signature(source.stat())
+
+    for key in sorted(set(previous) - result.files.keys()):
+        remove_output(dest_root / key, dest_root)
+        result.removed.append(key)
+
+    return result
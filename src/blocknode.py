@@ -1,6 +1,7 @@
 from enum import Enum
 from htmlnode import HTMLNode
-import re
+
+from grammar import FENCE, HEADING, ORDERED_LIST, QUOTE, UNORDERED_LIST, grammar
 
 from parentnode import ParentNode
 from leafnode import LeafNode
@@ -16,7 +17,14 @@ class BlockType(Enum):
     PARAGRAPH = "paragraph"
 
 
+BLOCK_TYPES = {block_type.value: block_type for block_type in BlockType}
+LINE_BLOCK_TYPES = (QUOTE, UNORDERED_LIST, ORDERED_LIST)
+HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
 class BlockNode:
+    __slots__ = ("text", "block_type")
+
     def __init__(self, text, block_type):
         self.text = text
         self.block_type = block_type
@@ -29,34 +37,69 @@ class BlockNode:
 
 
 def markdown_to_blocks(markdown):
-    result = [l.strip() for l in markdown.split(sep="\n\n") if l]
-    return result
+    return [block.text for block in iter_blocks(markdown.splitlines())]
+
+
+def iter_blocks(lines):
+    is_fence = grammar().is_fence
+    block = []
+    in_code = False
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if in_code:
+            block.append(line)
+            if is_fence(line):
+                yield BlockNode("\n".join(block).strip(), BlockType.CODE)
+                block = []
+                in_code = False
+            continue
+
+        if not line.strip():
+            if block:
+                yield lines_to_block_node(block)
+                block = []
+            continue
+
+        if is_fence(line):
+            if block:
+                yield lines_to_block_node(block)
+            block = [line]
+            in_code = True
+            continue
+
+        block.append(line)
+
+    if block:
+        yield lines_to_block_node(block)
+
+
+def lines_to_block_node(lines):
+    parser = grammar()
+    text = "\n".join(lines).strip()
+    if len(lines) == 1 and parser.line_kind(text) == HEADING:
+        return BlockNode(text, BlockType.HEADING)
+    return BlockNode(text, lines_block_type(lines, parser))
+
+
+def lines_block_type(lines, parser):
+    kinds = set(map(parser.line_kind, lines))
+    for kind in LINE_BLOCK_TYPES:
+        if kind in kinds:
+            return BLOCK_TYPES[kind]
+    return BlockType.PARAGRAPH
 
 
 def block_to_block_type(block_of_markdown_text):
-    match block_of_markdown_text:
-        case block_of_markdown_text if re.match(r"^#{1,6} .*$", block_of_markdown_text):
-            return BlockType.HEADING
-        case block_of_markdown_text if re.findall(
-            r"^\s*`{3}(.*?)\n(.*?)^\s*`{3}",
-            block_of_markdown_text,
-            flags=re.MULTILINE | re.DOTALL,
-        ):
-            return BlockType.CODE
-        case block_of_markdown_text if re.findall(
-            r"^>.*$", block_of_markdown_text, flags=re.MULTILINE
-        ):
-            return BlockType.QUOTE
-        case block_of_markdown_text if re.findall(
-            r"^(\*|-)\s.*$", block_of_markdown_text, flags=re.MULTILINE
-        ):
-            return BlockType.UNORDERED_LIST
-        case block_of_markdown_text if re.findall(
-            r"^\d+\.\s.*$", block_of_markdown_text, flags=re.MULTILINE
-        ):
-            return BlockType.ORDERED_LIST
-        case _:
-            return BlockType.PARAGRAPH
+    parser = grammar()
+    first_line, _, rest = block_of_markdown_text.partition("\n")
+    if not rest and parser.line_kind(first_line) == HEADING:
+        return BlockType.HEADING
+    if FENCE in block_of_markdown_text and parser.code_block.search(
+        block_of_markdown_text
+    ):
+        return BlockType.CODE
+    return lines_block_type(block_of_markdown_text.split("\n"), parser)
 
 
 def text_node_to_html_node(block_node):
@@ -82,9 +125,10 @@ def paragraph_to_html_node(text):
 
 
 def heading_to_html_node(text):
-    hash_count = text.count("#")
     texts = text.split(" ", 1)
-    return ParentNode(tag=f"h{hash_count}", children=text_to_children(texts[1]))
+    return ParentNode(
+        tag=HEADING_TAGS[len(texts[0]) - 1], children=text_to_children(texts[1])
+    )
 
 
 def code_to_html_node(text):
@@ -115,13 +159,17 @@ def ordered_list_to_html_node(text):
 
 
 def markdown_to_html_node(markdown) -> HTMLNode:
-    blocks = markdown_to_blocks(markdown)
-    block_nodes = [BlockNode(block, block_to_block_type(block)) for block in blocks]
+    block_nodes = list(iter_blocks(markdown.splitlines()))
     page = page_layering(block_nodes)
 
     return page
 
 
+def iter_html_nodes(block_nodes):
+    for block_node in block_nodes:
+        yield text_node_to_html_node(block_node)
+
+
 def page_layering(block_nodes: list[BlockNode]) -> HTMLNode:
     children = [text_node_to_html_node(block_node) for block_node in block_nodes]
     parent_page = ParentNode(tag="div", children=children)
@@ -130,7 +178,10 @@ def page_layering(block_nodes: list[BlockNode]) -> HTMLNode:
 
 
 def extract_title(markdown):
-    blocks = markdown_to_blocks(markdown)
+    return title_from_blocks(markdown_to_blocks(markdown))
+
+
+def title_from_blocks(blocks):
     result = [block[2:] for block in blocks if block.startswith("# ")]
 
     if not result:
@@ -0,0 +1,133 @@
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from manifest import generator_version, hash_bytes
+
+CACHE_PATH = ".cache/fragments.sqlite"
+MAX_BYTES = 256 * 1024 * 1024
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS fragments ("
+    "key TEXT PRIMARY KEY, title TEXT, html TEXT, size INTEGER, last_used INTEGER)",
+    "CREATE INDEX IF NOT EXISTS fragments_last_used ON fragments (last_used)",
+    "CREATE TABLE IF NOT EXISTS links (key TEXT PRIMARY KEY, links TEXT)",
+)
+
+_connections = {}
+
+
+def connect(path: str, schema=()) -> sqlite3.Connection:
+    key = (os.getpid(), path)
+    connection = _connections.get(key)
+    if connection is None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in schema:
+            connection.execute(statement)
+        _connections[key] = connection
+    return connection
+
+
+class FragmentCache:
+    def __init__(self, path=CACHE_PATH, max_bytes=MAX_BYTES):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return connect(self.path, SCHEMA)
+
+    @staticmethod
+    def key(markdown: str, basepath: str, assets=None, minify=False) -> str:
+        assets_digest = assets.digest if assets is not None else ""
+        options = f"{basepath}\0{assets_digest}\0{int(minify)}"
+        version = generator_version()
+        return hash_bytes(f"{version}\0{options}\0{markdown}".encode())
+
+    def get(self, key):
+        row = self.connection.execute(
+            "SELECT title, html FROM fragments WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE fragments SET last_used = ? WHERE key = ?", (time.time_ns(), key)
+        )
+        return row
+
+    def put(self, key, title, html):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO fragments VALUES (?, ?, ?, ?, ?)",
+            (key, title, html, len(title) + len(html), time.time_ns()),
+        )
+
+    def get_links(self, key):
+        row = self.connection.execute(
+            "SELECT links FROM links WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return [tuple(link) for link in json.loads(row[0])]
+
+    def put_links(self, key, links):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO links VALUES (?, ?)", (key, json.dumps(links))
+        )
+
+    def evict(self) -> int:
+        total = self.size()
+        if total <= self.max_bytes:
+            return 0
+
+        stale = []
+        rows = self.connection.execute(
+            "SELECT key, size FROM fragments ORDER BY last_used"
+        )
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        self.connection.executemany("DELETE FROM fragments WHERE key = ?", stale)
+        self.connection.executemany("DELETE FROM links WHERE key = ?", stale)
+        return len(stale)
+
+    def size(self) -> int:
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM fragments"
+        ).fetchone()[0]
+
+    def stats(self) -> dict:
+        entries = self.connection.execute("SELECT COUNT(*) FROM fragments").fetchone()
+        return {
+            "path": self.path,
+            "entries": entries[0],
+            "bytes": self.size(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self.connection.execute("DELETE FROM fragments")
+        self.connection.execute("DELETE FROM links")
+        self.connection.execute("VACUUM")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path}, {self.max_bytes})"
+
+
+if __name__ == "__main__":
+    from cli import run
+
+    raise SystemExit(run(["cache", *sys.argv[1:]]))
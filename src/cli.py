@@ -0,0 +1,278 @@
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def add_build_arguments(parser):
+    parser.add_argument("basepath", nargs="?", default="/")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only rebuild pages and static files whose content changed",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="render pages across N worker processes",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse rendered page bodies from the on-disk fragment cache",
+    )
+    parser.add_argument(
+        "--fingerprint",
+        action="store_true",
+        help="rename static files to name.<hash>.ext and rewrite references",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="drop redundant whitespace and optional closing tags from pages",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="write precompressed .gz (and .br if brotli is installed) files",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="overlap reading, rendering and writing pages in concurrent stages",
+    )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        help="keep front matter of every page in .cache/pages.sqlite",
+    )
+    parser.add_argument(
+        "--listings",
+        nargs="*",
+        metavar="SECTION",
+        help="generate listing, tag and archive pages for these content "
+        "directories (default: blog); implies --index",
+    )
+    parser.add_argument(
+        "--check-links",
+        action="store_true",
+        help="report internal links and images that point at nothing, then fail",
+    )
+    parser.add_argument(
+        "--link-graph", metavar="FILE", help="write the site's link graph (JSON)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each build stage and page, then print a report (runs serially)",
+    )
+    parser.add_argument("--profile-top", type=int, default=10, metavar="N")
+    parser.add_argument("--trace", metavar="FILE", help="write a Chrome trace (JSON)")
+    parser.add_argument(
+        "--profile-stats", metavar="FILE", help="write cProfile stats for pstats"
+    )
+
+
+def listing_sections(sections):
+    if sections is None:
+        return None
+    return tuple(sections) or ("blog",)
+
+
+def build_command(arguements) -> int:
+    from cache import FragmentCache
+    from main import main
+    from profiling import profile_build
+
+    cache = FragmentCache() if arguements.cache else None
+    options = {
+        "incremental": arguements.incremental,
+        "cache": cache,
+        "fingerprint": arguements.fingerprint,
+        "compress": arguements.compress,
+        "minify": arguements.minify,
+        "check_links": arguements.check_links,
+        "link_graph": arguements.link_graph,
+        "pipeline": arguements.pipeline,
+        "index": arguements.index,
+        "listings": listing_sections(arguements.listings),
+    }
+
+    results = []
+    if arguements.profile:
+        profile_build(
+            lambda: results.append(main(arguements.basepath, **options)),
+            count=arguements.profile_top,
+            trace_path=arguements.trace,
+            stats_path=arguements.profile_stats,
+        )
+    else:
+        results.append(main(arguements.basepath, jobs=arguements.jobs, **options))
+
+    if arguements.check_links and results and results[0]:
+        return 1
+    return 0
+
+
+def add_watch_arguments(parser):
+    parser.add_argument("basepath", nargs="?", default="/")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument("--interval", type=float, default=0.1)
+    parser.add_argument("--debounce", type=float, default=0.05)
+
+
+def watch_command(arguements) -> int:
+    from watch import main
+
+    main(arguements.basepath, arguements.port, arguements.interval, arguements.debounce)
+    return 0
+
+
+def add_serve_arguments(parser):
+    parser.add_argument("directory", nargs="?", default="docs")
+    parser.add_argument("--port", type=int, default=8888)
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help="build the site first, then serve it from memory",
+    )
+    parser.add_argument(
+        "--dynamic",
+        action="store_true",
+        help="skip the build and render each page from content/ on request",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        metavar="N",
+        help="rendered pages kept in memory in --dynamic mode",
+    )
+    parser.add_argument("--minify", action="store_true")
+    parser.add_argument("--basepath", default="/")
+    parser.add_argument(
+        "--verbose", action="store_true", help="log every request to stderr"
+    )
+
+
+def serve_command(arguements) -> int:
+    from serve import serve
+
+    site = None
+    if arguements.dynamic:
+        from dynamic import DynamicSite
+
+        site = DynamicSite(
+            arguements.basepath,
+            capacity=arguements.cache_size,
+            minify=arguements.minify,
+        )
+    elif arguements.build:
+        from main import main
+
+        main(arguements.basepath, minify=arguements.minify)
+    serve(arguements.directory, arguements.port, arguements.verbose, site=site)
+    return 0
+
+
+def add_bench_arguments(parser):
+    parser.add_argument(
+        "suite",
+        nargs="?",
+        default="",
+        help="bench module to run (inline, blocks, memory, minify, grammar, "
+        "loadtest); "
+        "defaults to the stage benchmark",
+    )
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+
+
+def bench_command(arguements) -> int:
+    import runpy
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    module = f"bench.{arguements.suite}" if arguements.suite else "bench"
+    sys.argv = [module, *arguements.args]
+    runpy.run_module(module, run_name="__main__", alter_sys=True)
+    return 0
+
+
+def add_cache_arguments(parser):
+    parser.add_argument("action", choices=("stats", "clear"))
+    parser.add_argument(
+        "--path", help="cache database (default: .cache/fragments.sqlite)"
+    )
+
+
+def cache_command(arguements) -> int:
+    from cache import CACHE_PATH, FragmentCache
+
+    cache = FragmentCache(arguements.path or CACHE_PATH)
+    if arguements.action == "clear":
+        cache.clear()
+        print(f"Cleared {cache.path}")
+    else:
+        for name, value in cache.stats().items():
+            if name not in ("hits", "misses"):
+                print(f"{name}: {value}")
+    return 0
+
+
+def add_pages_arguments(parser):
+    parser.add_argument("--tag")
+    parser.add_argument("--order", choices=("date", "title", "path", "words"))
+    parser.add_argument("--ascending", action="store_true")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--path", help="page index (default: .cache/pages.sqlite)")
+
+
+def pages_command(arguements) -> int:
+    from pageindex import INDEX_PATH, PageIndex
+
+    index = PageIndex(arguements.path or INDEX_PATH)
+    for record in index.pages(
+        arguements.tag,
+        arguements.order or "date",
+        not arguements.ascending,
+        arguements.limit,
+    ):
+        print(
+            f"{record.date or '-':<10} {record.words:>6} {record.path}  "
+            f"{record.title}  [{', '.join(record.tags)}]"
+        )
+    return 0
+
+
+COMMANDS = {
+    "build": (add_build_arguments, build_command, "generate the site into docs/"),
+    "watch": (add_watch_arguments, watch_command, "rebuild on change and serve"),
+    "serve": (add_serve_arguments, serve_command, "serve a built directory"),
+    "bench": (add_bench_arguments, bench_command, "run a benchmark suite"),
+    "cache": (add_cache_arguments, cache_command, "inspect or clear the cache"),
+    "pages": (add_pages_arguments, pages_command, "query the page index"),
+}
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="site", description="markdown static site generator"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, (add_arguments, command, help) in COMMANDS.items():
+        subparser = commands.add_parser(name, help=help)
+        add_arguments(subparser)
+        subparser.set_defaults(handler=command)
+    return parser
+
+
+def run(argv=None) -> int:
+    arguements = make_parser().parse_args(argv)
+    return arguements.handler(arguements)
+
+
+if __name__ == "__main__":
+    raise SystemExit(run())
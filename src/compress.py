@@ -0,0 +1,162 @@
+import gzip
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".svg", ".json", ".xml", ".txt")
+MIN_SIZE = 1024
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+COMPRESS_MANIFEST = ".cache/compressed.json"
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def brotli_bytes(data: bytes) -> bytes:
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+ENCODINGS = {".gz": gzip_bytes}
+if brotli is not None:
+    ENCODINGS[".br"] = brotli_bytes
+
+
+class CompressionResult:
+    def __init__(self):
+        self.compressed = []
+        self.skipped = []
+        self.removed = []
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self.compressed)} compressed, "
+            f"{len(self.skipped)} unchanged, {len(self.removed)} removed)"
+        )
+
+
+def is_compressible(path: Path) -> bool:
+    return path.suffix in COMPRESSIBLE_SUFFIXES
+
+
+def compressed_path(path: Path, suffix: str) -> Path:
+    return path.with_name(path.name + suffix)
+
+
+def load_compressed(manifest_path) -> set:
+    try:
+        with open(manifest_path, "r") as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_compressed(manifest_path, paths):
+    Path(manifest_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(f"{manifest_path}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(sorted(paths), f, indent=2)
+    tmp_path.replace(manifest_path)
+
+
+def is_owned(output: Path, stat: os.stat_result, owned) -> bool:
+    if owned is None or output in owned:
+        return True
+    try:
+        return output.stat().st_mtime_ns == stat.st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def compress_file(path: Path, min_size=MIN_SIZE, encodings=None, owned=None) -> tuple:
+    encodings = ENCODINGS if encodings is None else encodings
+    stat = path.stat()
+    written = []
+    removed = []
+    data = None
+
+    for suffix, codec in encodings.items():
+        output = compressed_path(path, suffix)
+        if not is_owned(output, stat, owned):
+            continue
+        if stat.st_size < min_size:
+            if output.exists():
+                output.unlink()
+                removed.append(output)
+            continue
+        try:
+            if output.stat().st_mtime_ns == stat.st_mtime_ns:
+                continue
+        except FileNotFoundError:
+            pass
+
+        if data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        compressed = codec(data)
+        if len(compressed) >= len(data):
+            if output.exists():
+                output.unlink()
+                removed.append(output)
+            continue
+
+        tmp = output.with_name(output.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(compressed)
+        os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp, output)
+        written.append(output)
+
+    return written, removed
+
+
+def compress_outputs(
+    dest_path,
+    jobs=8,
+    min_size=MIN_SIZE,
+    encodings=None,
+    manifest_path=COMPRESS_MANIFEST,
+) -> CompressionResult:
+    encodings = ENCODINGS if encodings is None else encodings
+    result = CompressionResult()
+    root = Path(dest_path)
+    owned = {root / key for key in load_compressed(manifest_path)}
+
+    sources = []
+    for content in os.walk(dest_path):
+        directory = Path(content[0])
+        names = set(content[2])
+        for name in content[2]:
+            path = directory / name
+            suffix = path.suffix
+            if suffix in encodings:
+                if path in owned and path.name[: -len(suffix)] not in names:
+                    path.unlink()
+                    result.removed.append(path)
+            elif is_compressible(path):
+                sources.append(path)
+
+    def compress(path):
+        return path, compress_file(path, min_size, encodings, owned)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for path, (written, removed) in executor.map(compress, sources):
+            if written:
+                result.compressed.extend(written)
+            elif not removed and path.stat().st_size >= min_size:
+                result.skipped.append(path)
+            result.removed.extend(removed)
+
+    owned = (owned | set(result.compressed)) - set(result.removed)
+    save_compressed(
+        manifest_path,
+        [path.relative_to(root).as_posix() for path in owned if path.exists()],
+    )
+    return result
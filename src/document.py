@@ -0,0 +1,137 @@
+import re
+from functools import cached_property
+
+from blocknode import (
+    BlockNode,
+    BlockType,
+    iter_blocks,
+    page_layering,
+    title_from_blocks,
+)
+from htmlnode import HTMLNode
+
+FRONT_MATTER_FENCE = "---"
+FRONT_MATTER = re.compile(r"\A---[ \t]*\n(.*?)^---[ \t]*(?:\n|\Z)", re.M | re.S)
+FRONT_MATTER_KEY = re.compile(r"[A-Za-z_][\w-]*")
+
+
+class Document:
+    def __init__(self, blocks: list[BlockNode], metadata=None):
+        self.blocks = blocks
+        self.metadata = metadata if metadata is not None else {}
+
+    @property
+    def block_types(self) -> list[BlockType]:
+        return [block.block_type for block in self.blocks]
+
+    @cached_property
+    def title(self) -> str:
+        if self.metadata.get("title"):
+            return self.metadata["title"]
+        return title_from_blocks(block.text for block in self.blocks)
+
+    @cached_property
+    def words(self) -> int:
+        return count_words(self.blocks)
+
+    @cached_property
+    def headings(self) -> list[tuple[int, str]]:
+        headings = []
+        for block in self.blocks:
+            if block.block_type == BlockType.HEADING:
+                hashes, text = block.text.split(" ", 1)
+                headings.append((len(hashes), text))
+        return headings
+
+    def to_html_node(self) -> HTMLNode:
+        return page_layering(self.blocks)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.blocks)} blocks, {self.metadata})"
+
+
+class WordCount:
+    def __init__(self):
+        self.words = 0
+
+    def blocks(self, blocks):
+        for block in blocks:
+            self.words += len(block.text.split())
+            yield block
+
+
+def count_words(blocks) -> int:
+    return sum(len(block.text.split()) for block in blocks)
+
+
+def parse_document(markdown: str) -> Document:
+    metadata, body = split_front_matter(markdown)
+    return Document(list(iter_blocks(body.splitlines())), metadata)
+
+
+def split_front_matter(markdown: str) -> tuple[dict, str]:
+    match = FRONT_MATTER.match(markdown)
+    if match is None:
+        return {}, markdown
+    metadata = parse_front_matter(match.group(1).splitlines())
+    if metadata is None:
+        return {}, markdown
+    return metadata, markdown[match.end() :]
+
+
+def read_front_matter(f) -> dict:
+    if f.readline().rstrip() != FRONT_MATTER_FENCE:
+        f.seek(0)
+        return {}
+    lines = []
+    for line in iter(f.readline, ""):
+        if line.rstrip() == FRONT_MATTER_FENCE:
+            metadata = parse_front_matter(lines)
+            if metadata is None:
+                break
+            return metadata
+        lines.append(line)
+    f.seek(0)
+    return {}
+
+
+def parse_front_matter(lines):
+    metadata = {}
+    comments = False
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("#"):
+            comments = True
+            continue
+        key, separator, value = line.partition(":")
+        key = key.strip()
+        if not separator or not FRONT_MATTER_KEY.fullmatch(key):
+            return None
+        metadata[key.lower()] = parse_front_matter_value(value.strip())
+    if comments and not metadata:
+        return None
+    if "tags" in metadata and isinstance(metadata["tags"], str):
+        metadata["tags"] = [metadata["tags"]] if metadata["tags"] else []
+    return metadata
+
+
+def parse_front_matter_value(value: str):
+    if value.startswith("[") and value.endswith("]"):
+        items = (
+            parse_front_matter_value(item.strip()) for item in value[1:-1].split(",")
+        )
+        return [item for item in items if item]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def front_matter_values(metadata: dict) -> dict:
+    values = {}
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            value = ", ".join(value)
+        values[key[:1].upper() + key[1:]] = value
+    return values
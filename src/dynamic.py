@@ -0,0 +1,74 @@
+import os
+from functools import lru_cache
+from urllib.parse import unquote
+
+from serve import SiteFiles, body_entry
+from utils import html_file_name, render_page
+
+CACHE_SIZE = 256
+
+
+class DynamicSite:
+    def __init__(
+        self,
+        basepath="/",
+        content_path="content",
+        template_path="template.html",
+        static_path="static",
+        capacity=CACHE_SIZE,
+        minify=False,
+    ):
+        self.basepath = basepath
+        self.content_path = content_path
+        self.template_path = template_path
+        self.minify = minify
+        self.static = SiteFiles(static_path)
+        if os.path.isdir(static_path):
+            self.static.load()
+        self.render = lru_cache(maxsize=capacity)(self._render)
+
+    @property
+    def variants(self):
+        return self.static.variants
+
+    def source_path(self, key: str):
+        if not key or key.endswith("/"):
+            key += "index.html"
+        if key.endswith(".html"):
+            name = key[: -len(".html")] + ".md"
+        else:
+            name = f"{key}/index.md"
+        return os.path.join(self.content_path, *name.split("/"))
+
+    def resolve(self, url_path: str):
+        key = unquote(url_path.split("?", 1)[0].split("#", 1)[0]).lstrip("/")
+        if ".." in key.split("/"):
+            return None, None
+
+        source = self.source_path(key)
+        try:
+            mtime_ns = os.stat(source).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return self.static.resolve(url_path)
+        template_mtime_ns = os.stat(self.template_path).st_mtime_ns
+        return self.render(source, mtime_ns, template_mtime_ns)
+
+    def _render(self, source, mtime_ns, template_mtime_ns):
+        html = render_page(
+            self.basepath, source, self.template_path, minify=self.minify
+        )
+        relative = os.path.relpath(source, self.content_path)
+        key = html_file_name(relative).replace(os.sep, "/")
+        return key, body_entry(source, key, html.encode())
+
+    def negotiate(self, key, accept_encoding: str):
+        return self.static.negotiate(key, accept_encoding)
+
+    def __len__(self):
+        return self.render.cache_info().currsize
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.content_path}, "
+            f"{len(self)} pages cached, {len(self.static)} static files)"
+        )
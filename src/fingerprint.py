@@ -0,0 +1,93 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+
+from manifest import hash_bytes, hash_file
+
+FINGERPRINT_CACHE = ".cache/fingerprints.json"
+ASSET_MANIFEST = "asset-manifest.json"
+HASH_LENGTH = 8
+SKIPPED_SUFFIXES = (".html",)
+
+
+class AssetManifest:
+    def __init__(self, mapping: dict):
+        self.mapping = mapping
+        self.digest = hash_bytes(json.dumps(sorted(mapping.items())).encode())
+
+    def resolve(self, url: str) -> str:
+        end = len(url)
+        for separator in ("?", "#"):
+            index = url.find(separator)
+            if index != -1:
+                end = min(end, index)
+        fingerprinted = self.mapping.get(url[1:end])
+        if fingerprinted is None:
+            return url
+        return f"/{fingerprinted}{url[end:]}"
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.mapping, f, indent=2, sort_keys=True)
+
+    def __eq__(self, other):
+        return isinstance(other, AssetManifest) and self.digest == other.digest
+
+    def __hash__(self):
+        return hash(self.digest)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.mapping)} assets)"
+
+
+def fingerprinted_name(key: str, digest: str) -> str:
+    path = PurePosixPath(key)
+    return str(path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"))
+
+
+def load_hash_cache(path) -> dict:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fingerprint_assets(from_path, jobs=8, cache_path=FINGERPRINT_CACHE):
+    root = Path(from_path)
+    cached = load_hash_cache(cache_path)
+
+    files = {}
+    for content in os.walk(root):
+        for name in content[2]:
+            if name.endswith(SKIPPED_SUFFIXES):
+                continue
+            source = Path(content[0]) / name
+            stat = source.stat()
+            files[source.relative_to(root).as_posix()] = (
+                source,
+                [stat.st_size, stat.st_mtime_ns],
+            )
+
+    hashes = {}
+    stale = []
+    for key, (source, state) in files.items():
+        entry = cached.get(key)
+        if entry is not None and entry[:2] == state:
+            hashes[key] = entry[2]
+        else:
+            stale.append(key)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        digests = executor.map(hash_file, [files[key][0] for key in stale])
+        for key, digest in zip(stale, digests):
+            hashes[key] = digest
+
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "w") as f:
+        json.dump({key: files[key][1] + [hashes[key]] for key in files}, f)
+
+    return AssetManifest(
+        {key: fingerprinted_name(key, digest) for key, digest in sorted(hashes.items())}
+    )
@@ -0,0 +1,99 @@
+import re
+from functools import cache
+
+HEADING = "heading"
+CODE = "code"
+QUOTE = "quote"
+UNORDERED_LIST = "unordered_list"
+ORDERED_LIST = "ordered_list"
+PARAGRAPH = "paragraph"
+
+BOLD_PATTERN = r"\*{2}([^*]+?)\*{2}"
+ITALIC_PATTERN = r"_([^_]+?)_"
+CODE_PATTERN = r"`([^*]+?)`"
+LINK_PATTERN = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
+IMAGE_PATTERN = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+INLINE_MARKERS_PATTERN = r"[`*_!\[]"
+CODE_BLOCK_PATTERN = r"^\s*`{3}(.*?)\n(.*?)^\s*`{3}"
+
+FENCE = "```"
+MAX_HEADING_LEVEL = 6
+
+
+class Grammar:
+    __slots__ = (
+        "inline_markers",
+        "bold",
+        "italic",
+        "code",
+        "link",
+        "image",
+        "code_block",
+        "line_prefixes",
+        "_patterns",
+    )
+
+    def __init__(self):
+        self.inline_markers = re.compile(INLINE_MARKERS_PATTERN)
+        self.bold = re.compile(BOLD_PATTERN)
+        self.italic = re.compile(ITALIC_PATTERN)
+        self.code = re.compile(CODE_PATTERN)
+        self.link = re.compile(LINK_PATTERN)
+        self.image = re.compile(IMAGE_PATTERN)
+        self.code_block = re.compile(CODE_BLOCK_PATTERN, re.MULTILINE | re.DOTALL)
+        self._patterns = {
+            pattern.pattern: pattern
+            for pattern in (self.bold, self.italic, self.code, self.link, self.image)
+        }
+
+        self.line_prefixes = {
+            "#": HEADING,
+            ">": QUOTE,
+            "*": UNORDERED_LIST,
+            "-": UNORDERED_LIST,
+        }
+        for digit in "0123456789":
+            self.line_prefixes[digit] = ORDERED_LIST
+
+    def pattern(self, pattern: str) -> re.Pattern:
+        compiled = self._patterns.get(pattern)
+        if compiled is None:
+            compiled = self._patterns[pattern] = re.compile(pattern)
+        return compiled
+
+    def line_kind(self, line: str):
+        first = line[:1]
+        kind = self.line_prefixes.get(first)
+        if kind is None:
+            if first.isdecimal():
+                kind = ORDERED_LIST
+            else:
+                return None
+
+        if kind == HEADING:
+            level = len(line) - len(line.lstrip("#"))
+            if level <= MAX_HEADING_LEVEL and line[level : level + 1] == " ":
+                return HEADING
+            return None
+        if kind == UNORDERED_LIST:
+            return kind if line[1:2].isspace() else None
+        if kind == ORDERED_LIST:
+            index = 1
+            while line[index : index + 1].isdecimal():
+                index += 1
+            if line[index : index + 1] == "." and line[index + 1 : index + 2].isspace():
+                return ORDERED_LIST
+            return None
+        return kind
+
+    @staticmethod
+    def is_fence(line: str) -> bool:
+        return line.lstrip().startswith(FENCE)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self._patterns)} patterns)"
+
+
+@cache
+def grammar() -> Grammar:
+    return Grammar()
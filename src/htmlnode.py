@@ -1,4 +1,6 @@
 class HTMLNode:
+    __slots__ = ("tag", "value", "children", "props")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
@@ -6,8 +8,14 @@ class HTMLNode:
         self.props = props
 
     def to_html(self):
+        return "".join(self.iter_html())
+
+    def iter_html(self):
         raise NotImplementedError
 
+    def write_html(self, stream):
+        stream.writelines(self.iter_html())
+
     def props_to_html(self):
         return " " + " ".join(f'{k}="{v}"' for k, v in self.props.items())
 
@@ -2,20 +2,25 @@ from htmlnode import HTMLNode
 
 
 class LeafNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
         super().__init__(tag, value, None, props=props)
 
-    def to_html(self):
+    def iter_html(self):
         if self.value is None:
             raise ValueError
 
         if self.tag is None:
-            return self.value
+            yield self.value
+            return
 
         if self.tag == "a":
-            return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            yield f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
+            return
 
         if self.tag == "img":
-            return f"<{self.tag}{self.props_to_html()}>"
+            yield f"<{self.tag}{self.props_to_html()}>"
+            return
 
-        return f"<{self.tag}>{self.value}</{self.tag}>"
+        yield f"<{self.tag}>{self.value}</{self.tag}>"
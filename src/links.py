@@ -0,0 +1,111 @@
+import json
+
+from htmlnode import HTMLNode
+from template import URL_ATTRIBUTES
+
+
+class LinkGraph:
+    def __init__(self, links=None):
+        self.links = links if links is not None else {}
+
+    def add(self, source: str, links: list):
+        self.links[source] = links
+
+    def remove(self, source: str):
+        self.links.pop(source, None)
+
+    def edges(self):
+        for source, links in self.links.items():
+            for attribute, url, line in links:
+                yield source, attribute, url, line
+
+    def broken(self, targets: set) -> list:
+        return sorted(
+            (source, line or 0, attribute, url)
+            for source, attribute, url, line in self.edges()
+            if not resolves(url, targets)
+        )
+
+    def inbound(self) -> dict:
+        pages = {}
+        for source, _, url, _ in self.edges():
+            pages.setdefault(strip_url(url), set()).add(source)
+        return pages
+
+    def save(self, path, targets: set):
+        data = {
+            "pages": {
+                source: [
+                    {"attribute": attribute, "url": url, "line": line}
+                    for attribute, url, line in links
+                ]
+                for source, links in sorted(self.links.items())
+            },
+            "inbound": {
+                url: sorted(sources) for url, sources in sorted(self.inbound().items())
+            },
+            "broken": [
+                {"source": source, "line": line, "attribute": attribute, "url": url}
+                for source, line, attribute, url in self.broken(targets)
+            ],
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+    def __len__(self):
+        return sum(len(links) for links in self.links.values())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self.links)} pages, {len(self)} links)"
+
+
+def report_broken(graph: LinkGraph, targets: set, content_path="content") -> list:
+    broken = graph.broken(targets)
+    for source, line, attribute, url in broken:
+        location = f"{content_path}/{source}" + (f":{line}" if line else "")
+        print(f"Broken {attribute} in {location}: {url}")
+    print(
+        f"Checked {len(graph)} links on {len(graph.links)} pages: "
+        f"{len(broken)} broken"
+    )
+    return broken
+
+
+def strip_url(url: str) -> str:
+    for separator in ("#", "?"):
+        url = url.split(separator, 1)[0]
+    return url
+
+
+def resolves(url: str, targets: set) -> bool:
+    path = strip_url(url).strip("/")
+    if not path:
+        return "index.html" in targets
+    return (
+        path in targets or f"{path}/index.html" in targets or f"{path}.html" in targets
+    )
+
+
+def collect_links(node: HTMLNode, markdown: str = None) -> list:
+    links = []
+    cursor = 0
+    line = 1
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.props:
+            for attribute in URL_ATTRIBUTES:
+                url = current.props.get(attribute)
+                if url is None or not url.startswith("/") or url.startswith("//"):
+                    continue
+                location = None
+                if markdown is not None:
+                    index = markdown.find(f"({url}", cursor)
+                    if index != -1:
+                        line += markdown.count("\n", cursor, index)
+                        cursor = index
+                        location = line
+                links.append((attribute, url, location))
+        if current.children:
+            stack.extend(reversed(current.children))
+    return links
@@ -0,0 +1,271 @@
+import re
+import unicodedata
+from pathlib import Path
+
+from leafnode import LeafNode
+from manifest import hash_bytes, remove_output
+from parentnode import ParentNode
+from template import load_template, rewrite_node_urls
+
+PAGE_SIZE = 10
+SECTIONS = ("blog",)
+TAGS_PATH = "tags"
+SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+class ListingPage:
+    def __init__(self, base, title, records, number=1, count=1):
+        self.base = base
+        self.title = title
+        self.records = records
+        self.number = number
+        self.count = count
+
+    @property
+    def path(self) -> str:
+        return listing_path(self.base, self.number)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.path}, {len(self.records)} pages, "
+            f"{self.number}/{self.count})"
+        )
+
+
+class ListingResult:
+    def __init__(self):
+        self.written = []
+        self.skipped = []
+        self.removed = []
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self.written)} written, "
+            f"{len(self.skipped)} unchanged, {len(self.removed)} removed)"
+        )
+
+
+def listing_path(base: str, number: int = 1) -> str:
+    if number == 1:
+        return f"{base}/index.html"
+    return f"{base}/page/{number}/index.html"
+
+
+def listing_url(base: str, number: int = 1) -> str:
+    return "/" + listing_path(base, number).removesuffix("index.html")
+
+
+def page_url(key: str) -> str:
+    if key == "index.md" or key.endswith("/index.md"):
+        return "/" + key.removesuffix("index.md")
+    return "/" + key.removesuffix(".md") + ".html"
+
+
+def tag_slug(tag: str) -> str:
+    text = unicodedata.normalize("NFKD", tag).encode("ascii", "ignore").decode()
+    return SLUG_SEPARATORS.sub("-", text.lower()).strip("-") or "tag"
+
+
+def tag_slugs(tags) -> dict:
+    slugs = {}
+    used = set()
+    for tag in sorted(tags, key=lambda tag: (tag_slug(tag) != tag, tag)):
+        slug = base = tag_slug(tag)
+        number = 2
+        while slug in used:
+            slug = f"{base}-{number}"
+            number += 1
+        used.add(slug)
+        slugs[tag] = slug
+    return slugs
+
+
+def paginate(base, title, records, size=PAGE_SIZE) -> list:
+    count = max(1, -(-len(records) // size))
+    return [
+        ListingPage(
+            base,
+            title if number == 1 else f"{title} - page {number}",
+            records[(number - 1) * size : number * size],
+            number,
+            count,
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def listing_patterns(base: str) -> list:
+    if base == TAGS_PATH:
+        return [listing_path(base)]
+    return [listing_path(base), f"{base}/page/*/index.html"]
+
+
+def in_section(key: str, section: str) -> bool:
+    return key.startswith(f"{section}/") and key != f"{section}/index.md"
+
+
+def section_listings(section, records, size=PAGE_SIZE) -> list:
+    posts = [record for record in records if in_section(record.path, section)]
+    return paginate(section, section.capitalize(), posts, size)
+
+
+def tag_listings(tag, slug, records, size=PAGE_SIZE) -> list:
+    return paginate(f"{TAGS_PATH}/{slug}", f"Tagged {tag}", records, size)
+
+
+def tags_listing(counts: dict, slugs: dict) -> ListingPage:
+    tags = sorted((slugs[tag], tag, count) for tag, count in counts.items())
+    return ListingPage(TAGS_PATH, "Tags", tags)
+
+
+def collect_listings(records, sections=SECTIONS, size=PAGE_SIZE) -> list:
+    listings = []
+    for section in sections:
+        listings.extend(section_listings(section, records, size))
+
+    tagged = {}
+    for record in records:
+        for tag in record.tags:
+            tagged.setdefault(tag, []).append(record)
+    slugs = tag_slugs(tagged)
+    for tag in sorted(tagged, key=slugs.get):
+        listings.extend(tag_listings(tag, slugs[tag], tagged[tag], size))
+    if tagged:
+        counts = {tag: len(pages) for tag, pages in tagged.items()}
+        listings.append(tags_listing(counts, slugs))
+    return listings
+
+
+def changed_listings(index, changed, previous_tags, sections=SECTIONS, size=PAGE_SIZE):
+    listings = []
+    bases = []
+    for section in sections:
+        if any(in_section(record.path, section) for record in changed):
+            bases.append(section)
+            listings.extend(
+                section_listings(section, index.pages(section=section), size)
+            )
+
+    counts = index.tags()
+    slugs = tag_slugs(counts)
+    previous = tag_slugs(previous_tags)
+    tags = {tag for record in changed for tag in record.tags}
+    tags.update(
+        tag
+        for tag in slugs.keys() | previous.keys()
+        if slugs.get(tag) != previous.get(tag)
+    )
+    for tag in sorted(tags):
+        if tag in previous:
+            bases.append(f"{TAGS_PATH}/{previous[tag]}")
+        if tag in slugs:
+            bases.append(f"{TAGS_PATH}/{slugs[tag]}")
+            listings.extend(tag_listings(tag, slugs[tag], index.pages(tag=tag), size))
+    if tags:
+        bases.append(TAGS_PATH)
+        if counts:
+            listings.append(tags_listing(counts, slugs))
+    return listings, bases
+
+
+def listing_node(page: ListingPage) -> ParentNode:
+    if page.base == TAGS_PATH:
+        items = [
+            ParentNode(
+                "li",
+                [
+                    LeafNode("a", tag, {"href": listing_url(f"{TAGS_PATH}/{slug}")}),
+                    LeafNode(None, f" ({count})"),
+                ],
+            )
+            for slug, tag, count in page.records
+        ]
+    else:
+        items = []
+        for record in page.records:
+            children = [LeafNode("a", record.title, {"href": page_url(record.path)})]
+            if record.date:
+                children.extend((LeafNode(None, " "), LeafNode("time", record.date)))
+            items.append(ParentNode("li", children))
+
+    children = [LeafNode("h1", page.title)]
+    if items:
+        children.append(ParentNode("ul", items, {"class": "listing"}))
+    if page.count > 1:
+        children.append(pagination_node(page))
+    return ParentNode("div", children)
+
+
+def pagination_node(page: ListingPage) -> ParentNode:
+    links = []
+    if page.number > 1:
+        links.append(
+            LeafNode("a", "Newer", {"href": listing_url(page.base, page.number - 1)})
+        )
+    links.append(LeafNode("span", f"Page {page.number} of {page.count}"))
+    if page.number < page.count:
+        links.append(
+            LeafNode("a", "Older", {"href": listing_url(page.base, page.number + 1)})
+        )
+    return ParentNode("nav", links, {"class": "pagination"})
+
+
+def create_listings(
+    basepath,
+    template_path,
+    dest_path,
+    index,
+    sections=SECTIONS,
+    assets=None,
+    minify=False,
+    size=PAGE_SIZE,
+    changed=None,
+    previous_tags=None,
+) -> ListingResult:
+    root = Path(dest_path)
+    config = {"sections": list(sections), "size": size}
+    stored = index.listing_hashes()
+    if (
+        changed is None
+        or not stored
+        or index.listing_config() != config
+        or not all((root / path).exists() for path in stored)
+    ):
+        listings = collect_listings(index.pages(), sections, size)
+        previous = stored
+    else:
+        listings, bases = changed_listings(
+            index, changed, previous_tags or {}, sections, size
+        )
+        patterns = [pattern for base in bases for pattern in listing_patterns(base)]
+        previous = index.listing_hashes(patterns)
+    template = load_template(template_path, basepath, assets, minify)
+    result = ListingResult()
+
+    def is_content(path):
+        return index.get(path.removesuffix(".html") + ".md") is not None
+
+    hashes = {}
+    for page in listings:
+        if is_content(page.path):
+            continue
+        node = listing_node(page)
+        rewrite_node_urls(node, basepath, assets)
+        html = template.render({"Title": page.title, "Content": node})
+        hashes[page.path] = hash_bytes(html.encode())
+        dest = root / page.path
+        if previous.get(page.path) == hashes[page.path] and dest.exists():
+            result.skipped.append(page.path)
+            continue
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, "w") as f:
+            f.write(html)
+        result.written.append(page.path)
+
+    removed = previous.keys() - hashes.keys()
+    for path in sorted(removed):
+        if not is_content(path):
+            remove_output(root / path, root)
+        result.removed.append(path)
+    index.update_listings(hashes, removed, config)
+    return result
@@ -1,22 +1,111 @@
 import sys
 
+from fingerprint import fingerprint_assets
+from links import LinkGraph, report_broken
+from manifest import BuildManifest, hash_file
+from pageindex import PageIndex
 from utils import (
     delete_directory_content,
     create_public_content,
     create_html_content_from_md,
+    create_compressed_content,
+    html_file_name,
 )
 
 
-def main(basepath):
-    delete_directory_content(dest_path="docs")
-    create_public_content(dest_path="docs")
-    create_html_content_from_md(basepath, "content", "template.html", "docs")
+def main(
+    basepath,
+    incremental=False,
+    jobs=1,
+    cache=None,
+    fingerprint=False,
+    compress=False,
+    minify=False,
+    check_links=False,
+    link_graph=None,
+    pipeline=False,
+    index=False,
+    listings=None,
+):
+    index = PageIndex() if index or listings is not None else None
+    assets = fingerprint_assets("static") if fingerprint else None
+    links = LinkGraph() if check_links or link_graph else None
+
+    if not incremental:
+        delete_directory_content(dest_path="docs")
+        synced = create_public_content(dest_path="docs", assets=assets)
+        create_html_content_from_md(
+            basepath,
+            "content",
+            "template.html",
+            "docs",
+            jobs=jobs,
+            cache=cache,
+            assets=assets,
+            minify=minify,
+            links=links,
+            pipeline=pipeline,
+            index=index,
+            listings=listings,
+        )
+        if compress:
+            create_compressed_content(dest_path="docs", jobs=max(jobs, 8))
+        return check_site_links(links, synced, assets, link_graph, index)
+
+    template_hash = hash_file("template.html")
+    assets_digest = assets.digest if assets is not None else None
+    manifest = BuildManifest.load()
+    if (
+        manifest is None
+        or not manifest.is_current(basepath, template_hash, assets_digest, minify)
+        or (links is not None and manifest.links is None)
+    ):
+        delete_directory_content(dest_path="docs")
+        manifest = BuildManifest(
+            basepath, template_hash, assets=assets_digest, minify=minify
+        )
+    if links is not None:
+        links = LinkGraph(manifest.links)
+
+    synced = create_public_content(dest_path="docs", manifest=manifest, assets=assets)
+    create_html_content_from_md(
+        basepath,
+        "content",
+        "template.html",
+        "docs",
+        manifest=manifest,
+        jobs=jobs,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        links=links,
+        pipeline=pipeline,
+        index=index,
+        listings=listings,
+    )
+    if compress:
+        create_compressed_content(dest_path="docs", jobs=max(jobs, 8))
+    manifest.links = links.links if links is not None else None
+    manifest.save()
+    return check_site_links(links, synced, assets, link_graph, index)
+
+
+def check_site_links(links, synced, assets=None, link_graph=None, index=None):
+    if links is None:
+        return None
+
+    targets = {html_file_name(key) for key in links.links} | synced.files.keys()
+    if assets is not None:
+        targets |= assets.mapping.keys()
+    if index is not None:
+        targets |= index.listing_hashes().keys()
+    broken = report_broken(links, targets)
+    if link_graph:
+        links.save(link_graph, targets)
+    return broken
 
 
 if __name__ == "__main__":
-    arguements = sys.argv
-    basepath = "/"
-    if len(arguements) == 2:
-        basepath = arguements[1]
+    from cli import run
 
-    main(basepath)
+    raise SystemExit(run(["build", *sys.argv[1:]]))
@@ -0,0 +1,108 @@
+import hashlib
+import json
+from functools import cache
+from pathlib import Path
+
+GENERATOR_VERSION = "0.1.0"
+SOURCE_PATH = Path(__file__).parent
+MANIFEST_PATH = ".build_manifest.json"
+
+
+@cache
+def generator_version() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(SOURCE_PATH.glob("*.py")):
+        digest.update(f"{path.name}\0".encode())
+        digest.update(path.read_bytes())
+    return f"{GENERATOR_VERSION}+{digest.hexdigest()[:12]}"
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    def __init__(
+        self,
+        basepath,
+        template_hash,
+        version=None,
+        pages=None,
+        static=None,
+        assets=None,
+        minify=False,
+        links=None,
+    ):
+        self.basepath = basepath
+        self.template_hash = template_hash
+        self.version = version if version is not None else generator_version()
+        self.pages = pages if pages is not None else {}
+        self.static = static if static is not None else {}
+        self.assets = assets
+        self.minify = minify
+        self.links = links
+
+    def is_current(self, basepath, template_hash, assets=None, minify=False) -> bool:
+        return (
+            self.basepath == basepath
+            and self.template_hash == template_hash
+            and self.version == generator_version()
+            and self.assets == assets
+            and self.minify == minify
+        )
+
+    @classmethod
+    def load(cls, path=MANIFEST_PATH):
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            return cls(
+                data["basepath"],
+                data["template_hash"],
+                data["version"],
+                data["pages"],
+                data["static"],
+                data.get("assets"),
+                data.get("minify", False),
+                data.get("links"),
+            )
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def save(self, path=MANIFEST_PATH):
+        data = {
+            "version": self.version,
+            "basepath": self.basepath,
+            "template_hash": self.template_hash,
+            "pages": self.pages,
+            "static": self.static,
+            "assets": self.assets,
+            "minify": self.minify,
+            "links": self.links,
+        }
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        tmp_path.replace(path)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.basepath}, {self.template_hash}, {self.version})"
+
+
+def remove_output(path: Path, root: Path):
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    while parent != root and parent.is_relative_to(root):
+        try:
+            parent.rmdir()
+        except OSError:
+            break
+        parent = parent.parent
@@ -0,0 +1,143 @@
+import re
+
+from htmlnode import HTMLNode
+
+WHITESPACE = re.compile(r"\s+")
+INDENTATION = re.compile(r">\s*\n\s*<")
+SELF_CLOSING = re.compile(r"\s*/>")
+PRESERVED = re.compile(
+    r"\s*(<(pre|script|style|textarea)[\s>].*?</\2>)\s*", re.DOTALL | re.IGNORECASE
+)
+
+PRESERVED_TAGS = frozenset(("pre", "code", "script", "style", "textarea"))
+VOID_TAGS = frozenset(("img",))
+BLOCK_TAGS = frozenset(
+    (
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "div",
+        "dl",
+        "fieldset",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "table",
+        "ul",
+    )
+)
+CONTAINER_TAGS = frozenset(
+    (
+        "article",
+        "aside",
+        "div",
+        "footer",
+        "header",
+        "main",
+        "nav",
+        "ol",
+        "section",
+        "ul",
+    )
+)
+NO_IMPLIED_P_END = frozenset(("a", "audio", "del", "ins", "map", "noscript", "video"))
+
+
+def collapse_whitespace(text: str) -> str:
+    if "  " in text or "\n" in text or "\t" in text or "\r" in text:
+        return WHITESPACE.sub(" ", text)
+    return text
+
+
+def minify_segment(text: str) -> str:
+    text = INDENTATION.sub("><", text)
+    text = SELF_CLOSING.sub(">", text)
+    return collapse_whitespace(text.strip("\n"))
+
+
+def minify_markup(text: str) -> str:
+    parts = []
+    position = 0
+    for match in PRESERVED.finditer(text):
+        parts.append(minify_segment(text[position : match.start()]))
+        parts.append(match.group(1))
+        position = match.end()
+    parts.append(minify_segment(text[position:]))
+    return "".join(parts)
+
+
+def can_omit_end_tag(tag, next_tag, parent_tag) -> bool:
+    if tag == "li":
+        return next_tag is None or next_tag == "li"
+    if tag == "p":
+        if next_tag is None:
+            return parent_tag not in NO_IMPLIED_P_END
+        return next_tag in BLOCK_TAGS
+    return False
+
+
+def iter_minified_html(node: HTMLNode):
+    frames = [[iter(()), node, None, False, None]]
+    while frames:
+        frame = frames[-1]
+        children, current, parent_tag, preserve, end_tag = frame
+        if current is None:
+            frames.pop()
+            if end_tag is not None:
+                yield end_tag
+            continue
+
+        following = next(children, None)
+        frame[1] = following
+        next_tag = None if following is None else following.tag or ""
+        tag = current.tag
+        props = current.props_to_html() if current.props else ""
+
+        if current.children is None:
+            value = current.value
+            if value is None:
+                raise ValueError
+            if not preserve and tag not in PRESERVED_TAGS:
+                value = collapse_whitespace(value)
+            if tag is None:
+                if value.strip() or parent_tag not in CONTAINER_TAGS:
+                    yield value
+            elif tag in VOID_TAGS:
+                yield f"<{tag}{props}>"
+            elif can_omit_end_tag(tag, next_tag, parent_tag):
+                yield f"<{tag}{props}>{value}"
+            else:
+                yield f"<{tag}{props}>{value}</{tag}>"
+            continue
+
+        if not tag:
+            raise ValueError
+        yield f"<{tag}{props}>"
+        grandchildren = iter(current.children)
+        frames.append(
+            [
+                grandchildren,
+                next(grandchildren, None),
+                tag,
+                preserve or tag in PRESERVED_TAGS,
+                None if can_omit_end_tag(tag, next_tag, parent_tag) else f"</{tag}>",
+            ]
+        )
+
+
+def minify_html(node: HTMLNode) -> str:
+    return "".join(iter_minified_html(node))
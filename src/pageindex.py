@@ -0,0 +1,204 @@
+import json
+import sqlite3
+
+from cache import connect
+
+INDEX_PATH = ".cache/pages.sqlite"
+ORDERS = ("date", "title", "path", "words")
+COLUMNS = "path, title, date, tags, words, hash, metadata"
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS pages (path TEXT PRIMARY KEY, title TEXT, "
+    "date TEXT, tags TEXT, words INTEGER, hash TEXT, metadata TEXT)",
+    "CREATE INDEX IF NOT EXISTS pages_date ON pages (date)",
+    "CREATE TABLE IF NOT EXISTS tags (tag TEXT, path TEXT, PRIMARY KEY (tag, path))",
+    "CREATE TABLE IF NOT EXISTS listings (path TEXT PRIMARY KEY, hash TEXT)",
+    "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)",
+)
+
+
+class PageRecord:
+    def __init__(self, path, title, date, tags, words, hash, metadata=None):
+        self.path = path
+        self.title = title
+        self.date = date
+        self.tags = tags
+        self.words = words
+        self.hash = hash
+        self.metadata = metadata if metadata is not None else {}
+
+    def __eq__(self, other):
+        return isinstance(other, PageRecord) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path}, {self.title}, {self.date})"
+
+
+def page_record(metadata: dict, title, words: int) -> PageRecord:
+    return PageRecord(
+        None,
+        title or "",
+        metadata.get("date"),
+        metadata.get("tags", []),
+        words,
+        None,
+        metadata,
+    )
+
+
+class PageIndex:
+    def __init__(self, path=INDEX_PATH):
+        self.path = str(path)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return connect(self.path, SCHEMA)
+
+    def hashes(self) -> dict:
+        return dict(self.connection.execute("SELECT path, hash FROM pages"))
+
+    def update(self, records, keep=None) -> list:
+        removed = []
+        connection = self.connection
+        connection.execute("BEGIN")
+        try:
+            for record in records:
+                self._write(record)
+            if keep is not None:
+                removed = [path for path in self.hashes() if path not in keep]
+                for path in removed:
+                    self._delete(path)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return removed
+
+    def _write(self, record: PageRecord):
+        self._delete(record.path)
+        self.connection.execute(
+            "INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                record.path,
+                record.title,
+                record.date,
+                json.dumps(record.tags),
+                record.words,
+                record.hash,
+                json.dumps(record.metadata),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO tags VALUES (?, ?)",
+            [(tag, record.path) for tag in record.tags],
+        )
+
+    def _delete(self, path: str):
+        self.connection.execute("DELETE FROM pages WHERE path = ?", (path,))
+        self.connection.execute("DELETE FROM tags WHERE path = ?", (path,))
+
+    def get(self, path: str):
+        row = self.connection.execute(
+            f"SELECT {COLUMNS} FROM pages WHERE path = ?",
+            (path,),
+        ).fetchone()
+        return self._record(row) if row is not None else None
+
+    def pages(
+        self,
+        tag=None,
+        order="date",
+        descending=True,
+        limit=None,
+        offset=0,
+        section=None,
+    ):
+        if order not in ORDERS:
+            raise ValueError(f"Unknown page order: {order}")
+        query = f"SELECT {COLUMNS} FROM pages"
+        conditions = []
+        parameters = []
+        if tag is not None:
+            conditions.append("path IN (SELECT path FROM tags WHERE tag = ?)")
+            parameters.append(tag)
+        if section is not None:
+            conditions.append("substr(path, 1, ?) = ?")
+            parameters.extend((len(section) + 1, f"{section}/"))
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        direction = "DESC" if descending else "ASC"
+        query += f" ORDER BY {order} {direction}, path {direction}"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            parameters.extend((limit, offset))
+        return [self._record(row) for row in self.connection.execute(query, parameters)]
+
+    def tags(self) -> dict:
+        return dict(
+            self.connection.execute(
+                "SELECT tag, COUNT(*) FROM tags GROUP BY tag ORDER BY tag"
+            )
+        )
+
+    def count(self, tag=None) -> int:
+        if tag is None:
+            return self.connection.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM tags WHERE tag = ?", (tag,)
+        ).fetchone()[0]
+
+    def listing_hashes(self, patterns=None) -> dict:
+        if patterns is None:
+            return dict(self.connection.execute("SELECT path, hash FROM listings"))
+        hashes = {}
+        for pattern in patterns:
+            hashes.update(
+                self.connection.execute(
+                    "SELECT path, hash FROM listings WHERE path GLOB ?", (pattern,)
+                )
+            )
+        return hashes
+
+    def listing_config(self):
+        row = self.connection.execute(
+            "SELECT value FROM settings WHERE key = 'listings'"
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def update_listings(self, hashes: dict, removed=(), config=None):
+        connection = self.connection
+        connection.execute("BEGIN")
+        try:
+            if config is not None:
+                connection.execute(
+                    "INSERT OR REPLACE INTO settings VALUES ('listings', ?)",
+                    (json.dumps(config),),
+                )
+            connection.executemany(
+                "DELETE FROM listings WHERE path = ?", [(path,) for path in removed]
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?)", list(hashes.items())
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _record(row) -> PageRecord:
+        path, title, date, tags, words, digest, metadata = row
+        return PageRecord(
+            path, title, date, json.loads(tags), words, digest, json.loads(metadata)
+        )
+
+    def clear(self):
+        self.connection.execute("DELETE FROM pages")
+        self.connection.execute("DELETE FROM tags")
+        self.connection.execute("DELETE FROM listings")
+        self.connection.execute("DELETE FROM settings")
+
+    def __len__(self):
+        return self.count()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path})"
@@ -2,15 +2,20 @@ from htmlnode import HTMLNode
 
 
 class ParentNode(HTMLNode):
+    __slots__ = ()
+
     def __init__(self, tag, children, props=None):
         super().__init__(tag, None, children, props=props)
 
-    def to_html(self):
+    def iter_html(self):
         if not self.tag:
             raise ValueError
 
         if self.children is None:
             raise ValueError
 
-        child = "".join(c.to_html() for c in self.children)
-        return f"<{self.tag}>{child}</{self.tag}>"
+        props = self.props_to_html() if self.props else ""
+        yield f"<{self.tag}{props}>"
+        for child in self.children:
+            yield from child.iter_html()
+        yield f"</{self.tag}>"
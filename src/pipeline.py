@@ -0,0 +1,240 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+
+QUEUE_DEPTH = 32
+WRITE_BATCH = 16
+
+_done = object()
+
+
+class StageStats:
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy = 0.0
+        self.starved = 0.0
+        self.blocked = 0.0
+
+    def utilization(self, elapsed) -> float:
+        return self.busy / elapsed if elapsed else 0.0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, {self.items} items)"
+
+
+class PipelineReport:
+    def __init__(self, stages, elapsed):
+        self.stages = stages
+        self.elapsed = elapsed
+
+    def format(self) -> str:
+        lines = [
+            f"{'stage':<10} {'items':>7} {'busy ms':>10} {'starved ms':>11} "
+            f"{'blocked ms':>11} {'util':>6}"
+        ]
+        for stage in self.stages:
+            lines.append(
+                f"{stage.name:<10} {stage.items:>7} {stage.busy * 1000:>10.2f} "
+                f"{stage.starved * 1000:>11.2f} {stage.blocked * 1000:>11.2f} "
+                f"{stage.utilization(self.elapsed):>6.1%}"
+            )
+        lines.append(f"Pipeline finished in {self.elapsed * 1000:.2f} ms")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.elapsed:.3f}s)"
+
+
+class PipelineError(Exception):
+    def __init__(self, source, error):
+        super().__init__(f"Pipeline failed on {source}")
+        self.source = source
+        self.error = error
+
+
+def render_chunk(render, chunk):
+    return [render(source, markdown) for source, _, markdown in chunk]
+
+
+class BuildPipeline:
+    def __init__(
+        self,
+        render,
+        template_path,
+        jobs=1,
+        depth=QUEUE_DEPTH,
+        batch=WRITE_BATCH,
+        fsync=True,
+    ):
+        self.render = render
+        self.template_path = template_path
+        self.jobs = jobs
+        self.depth = depth
+        self.batch = batch
+        self.fsync = fsync
+        self.reads = Queue(maxsize=depth)
+        self.writes = Queue(maxsize=depth)
+        self.stages = [StageStats("read"), StageStats("render"), StageStats("write")]
+        self.links = {}
+        self.records = {}
+        self.error = None
+
+    def fail(self, source, error):
+        if self.error is None:
+            self.error = PipelineError(source, error)
+
+    def put(self, queue, item, stats):
+        start = time.perf_counter()
+        queue.put(item)
+        stats.blocked += time.perf_counter() - start
+
+    def get(self, queue, stats):
+        start = time.perf_counter()
+        item = queue.get()
+        stats.starved += time.perf_counter() - start
+        return item
+
+    def read(self, pages):
+        stats = self.stages[0]
+        for source, dest in pages:
+            if self.error is not None:
+                break
+            start = time.perf_counter()
+            try:
+                with open(source, "r") as f:
+                    markdown = f.read()
+            except Exception as e:
+                self.fail(source, e)
+                break
+            stats.busy += time.perf_counter() - start
+            stats.items += 1
+            self.put(self.reads, (source, dest, markdown), stats)
+        self.put(self.reads, _done, stats)
+
+    def render_serial(self):
+        stats = self.stages[1]
+        while (item := self.get(self.reads, stats)) is not _done:
+            if self.error is not None:
+                continue
+            source, dest, markdown = item
+            start = time.perf_counter()
+            try:
+                html, links, record = self.render(source, markdown)
+            except Exception as e:
+                self.fail(source, e)
+                continue
+            stats.busy += time.perf_counter() - start
+            stats.items += 1
+            self.put(self.writes, (source, dest, html, links, record), stats)
+        self.put(self.writes, _done, stats)
+
+    def render_parallel(self, executor):
+        stats = self.stages[1]
+        pending = deque()
+        chunk = []
+
+        def submit():
+            pending.append((chunk, executor.submit(render_chunk, self.render, chunk)))
+
+        def finish():
+            items, future = pending.popleft()
+            start = time.perf_counter()
+            try:
+                rendered = future.result()
+            except Exception as e:
+                self.fail_chunk(items, e)
+                return
+            stats.busy += time.perf_counter() - start
+            stats.items += len(items)
+            for (source, dest, _), (html, links, record) in zip(items, rendered):
+                self.put(self.writes, (source, dest, html, links, record), stats)
+
+        while (item := self.get(self.reads, stats)) is not _done:
+            if self.error is not None:
+                continue
+            chunk.append(item)
+            if len(chunk) >= self.batch or self.reads.empty():
+                submit()
+                chunk = []
+            if len(pending) >= self.jobs * 2:
+                finish()
+        if chunk:
+            submit()
+        while pending:
+            finish()
+        self.put(self.writes, _done, stats)
+
+    def fail_chunk(self, items, error):
+        for source, _, markdown in items:
+            try:
+                self.render(source, markdown)
+            except Exception as e:
+                self.fail(source, e)
+                return
+        self.fail(items[0][0], error)
+
+    def write(self):
+        stats = self.stages[2]
+        batch = []
+        while True:
+            item = self.get(self.writes, stats)
+            if item is not _done:
+                batch.append(item)
+                if len(batch) < self.batch and not self.writes.empty():
+                    continue
+            if batch and self.error is None:
+                start = time.perf_counter()
+                self.write_batch(batch)
+                stats.busy += time.perf_counter() - start
+                stats.items += len(batch)
+            batch = []
+            if item is _done:
+                break
+
+    def write_batch(self, batch):
+        files = []
+        source = batch[0][0]
+        try:
+            for source, dest, html, links, record in batch:
+                print(
+                    f"Generating page from {source} to {dest} using {self.template_path}"
+                )
+                f = open(dest, "w")
+                files.append(f)
+                f.write(html)
+                if links is not None:
+                    self.links[source] = links
+                if record is not None:
+                    self.records[source] = record
+                print("Finished generating page")
+            for f in files:
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+        except Exception as e:
+            self.fail(source, e)
+        finally:
+            for f in files:
+                f.close()
+
+    def run(self, pages) -> PipelineReport:
+        start = time.perf_counter()
+        reader = threading.Thread(target=self.read, args=(pages,), daemon=True)
+        writer = threading.Thread(target=self.write, daemon=True)
+        reader.start()
+        writer.start()
+        if self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                self.render_parallel(executor)
+        else:
+            self.render_serial()
+        reader.join()
+        writer.join()
+
+        if self.error is not None:
+            raise self.error
+        return PipelineReport(self.stages, time.perf_counter() - start)
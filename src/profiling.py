@@ -0,0 +1,122 @@
+import cProfile
+import json
+import os
+import time
+from contextlib import contextmanager, nullcontext
+
+PAGE_STAGE = "page"
+
+_active = None
+_disabled = nullcontext()
+
+
+class BuildProfiler:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+
+    @contextmanager
+    def stage(self, name, page=None):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self.events.append(
+                (
+                    name,
+                    page,
+                    wall - self.origin,
+                    time.perf_counter() - wall,
+                    time.process_time() - cpu,
+                )
+            )
+
+    def stage_totals(self) -> dict:
+        totals = {}
+        for name, _, _, wall, cpu in self.events:
+            if name == PAGE_STAGE:
+                continue
+            total = totals.setdefault(name, [0.0, 0.0, 0])
+            total[0] += wall
+            total[1] += cpu
+            total[2] += 1
+        return totals
+
+    def slowest_pages(self, count=10) -> list:
+        pages = [
+            (str(page), wall, cpu)
+            for name, page, _, wall, cpu in self.events
+            if name == PAGE_STAGE
+        ]
+        return sorted(pages, key=lambda p: p[1], reverse=True)[:count]
+
+    def report(self, count=10) -> str:
+        lines = [f"{'stage':<24} {'calls':>7} {'wall ms':>10} {'cpu ms':>10}"]
+        totals = sorted(
+            self.stage_totals().items(), key=lambda t: t[1][0], reverse=True
+        )
+        for name, (wall, cpu, calls) in totals:
+            lines.append(
+                f"{name:<24} {calls:>7} {wall * 1000:>10.2f} {cpu * 1000:>10.2f}"
+            )
+
+        pages = self.slowest_pages(count)
+        if pages:
+            lines.append("")
+            lines.append(f"Slowest {len(pages)} page(s):")
+            for page, wall, cpu in pages:
+                lines.append(
+                    f"{wall * 1000:>10.2f} ms wall {cpu * 1000:>10.2f} ms cpu  {page}"
+                )
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": "build",
+                "ph": "X",
+                "ts": start * 1_000_000,
+                "dur": wall * 1_000_000,
+                "pid": pid,
+                "tid": 0,
+                "args": {"page": str(page) if page else None, "cpu_ms": cpu * 1000},
+            }
+            for name, page, start, wall, cpu in self.events
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def profile_stage(name, page=None):
+    if _active is None:
+        return _disabled
+    return _active.stage(name, page)
+
+
+def profiling_enabled() -> bool:
+    return _active is not None
+
+
+def profile_build(build, count=10, trace_path=None, stats_path=None):
+    global _active
+    profiler = BuildProfiler()
+    stats = cProfile.Profile() if stats_path else None
+
+    _active = profiler
+    try:
+        if stats is not None:
+            stats.runcall(build)
+        else:
+            build()
+    finally:
+        _active = None
+
+    print(profiler.report(count))
+    if trace_path:
+        profiler.write_chrome_trace(trace_path)
+    if stats is not None:
+        stats.dump_stats(stats_path)
+    return profiler
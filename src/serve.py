@@ -0,0 +1,238 @@
+import hashlib
+import mimetypes
+import os
+import re
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+SENDFILE_THRESHOLD = 256 * 1024
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+ENCODED_TYPES = {"gzip": "application/gzip", "br": "application/x-brotli"}
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{8}\.[^./]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+
+class Entry:
+    __slots__ = ("path", "body", "size", "etag", "content_type", "cache_control")
+
+    def __init__(self, path, body, size, etag, content_type, cache_control):
+        self.path = path
+        self.body = body
+        self.size = size
+        self.etag = etag
+        self.content_type = content_type
+        self.cache_control = cache_control
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path}, {self.size} bytes)"
+
+
+def load_entry(path, key, threshold=SENDFILE_THRESHOLD, suffix="") -> Entry:
+    size = os.path.getsize(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        if size < threshold:
+            body = f.read()
+            digest.update(body)
+        else:
+            body = None
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+    return make_entry(path, key, body, size, digest, suffix)
+
+
+def body_entry(path, key, body: bytes) -> Entry:
+    return make_entry(path, key, body, len(body), hashlib.sha256(body))
+
+
+def make_entry(path, key, body, size, digest, suffix="") -> Entry:
+    content_type, encoding = mimetypes.guess_type(key)
+    if encoding is not None:
+        content_type = ENCODED_TYPES.get(encoding)
+    content_type = content_type or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in (
+        "application/javascript",
+        "application/json",
+        "image/svg+xml",
+    ):
+        content_type += "; charset=utf-8"
+    cache_control = IMMUTABLE if FINGERPRINTED.search(key) else REVALIDATE
+    etag = f'"{digest.hexdigest()[:20]}{suffix}"'
+    return Entry(path, body, size, etag, content_type, cache_control)
+
+
+class SiteFiles:
+    def __init__(self, directory, threshold=SENDFILE_THRESHOLD):
+        self.directory = directory
+        self.threshold = threshold
+        self.files = {}
+        self.variants = {}
+
+    def load(self):
+        paths = {}
+        for content in os.walk(self.directory):
+            for name in content[2]:
+                path = os.path.join(content[0], name)
+                key = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                paths[key] = path
+
+        files = {}
+        variants = {}
+        for key, path in paths.items():
+            for encoding, suffix in ENCODINGS:
+                original = key.removesuffix(suffix)
+                if original != key and original in paths:
+                    entry = load_entry(path, original, self.threshold, suffix)
+                    variants.setdefault(original, {})[encoding] = entry
+                    break
+            else:
+                files[key] = load_entry(path, key, self.threshold)
+
+        self.files = files
+        self.variants = variants
+        return self
+
+    def resolve(self, url_path: str):
+        key = unquote(url_path.split("?", 1)[0].split("#", 1)[0]).strip("/")
+        if ".." in key.split("/"):
+            return None, None
+        for candidate in (key, f"{key}/index.html" if key else "index.html"):
+            entry = self.files.get(candidate)
+            if entry is not None:
+                return candidate, entry
+        return None, None
+
+    def negotiate(self, key, accept_encoding: str):
+        variants = self.variants.get(key)
+        if not variants or not accept_encoding:
+            return None, None
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding, _ in ENCODINGS:
+            if encoding in variants and accepted.get(encoding, accepted.get("*", 0)):
+                return encoding, variants[encoding]
+        return None, None
+
+    def __len__(self):
+        return len(self.files)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.directory}, {len(self)} files)"
+
+
+def parse_accept_encoding(header: str) -> dict:
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "SiteServer/1.0"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        site = self.server.site
+        try:
+            key, entry = site.resolve(self.path)
+        except Exception as e:
+            self.log_error("Failed to serve %s: %r", self.path, e)
+            self.send_plain(
+                HTTPStatus.INTERNAL_SERVER_ERROR, b"Internal Server Error", send_body
+            )
+            return
+        if entry is None:
+            self.send_plain(HTTPStatus.NOT_FOUND, b"Not Found", send_body)
+            return
+
+        encoding, variant = site.negotiate(key, self.headers.get("Accept-Encoding"))
+        served = variant or entry
+
+        if etag_matches(self.headers.get("If-None-Match", ""), served.etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_entry_headers(key, entry, served, encoding)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_entry_headers(key, entry, served, encoding)
+        self.send_header("Content-Length", str(served.size))
+        self.end_headers()
+        if send_body:
+            self.send_body(served)
+
+    def send_entry_headers(self, key, entry, served, encoding):
+        self.send_header("Content-Type", entry.content_type)
+        self.send_header("ETag", served.etag)
+        self.send_header("Cache-Control", entry.cache_control)
+        if self.server.site.variants.get(key):
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+
+    def send_body(self, served):
+        if served.body is not None:
+            self.wfile.write(served.body)
+            return
+        self.wfile.flush()
+        with open(served.path, "rb") as f:
+            self.connection.sendfile(f)
+
+    def send_plain(self, status, body, send_body):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class SiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, site: SiteFiles, verbose=False):
+        super().__init__(address, SiteRequestHandler)
+        self.site = site
+        self.verbose = verbose
+
+
+def serve(
+    directory="docs", port=8888, verbose=False, threshold=SENDFILE_THRESHOLD, site=None
+):
+    if site is None:
+        site = SiteFiles(directory, threshold).load()
+    server = SiteServer(("", port), site, verbose)
+    print(f"Serving {site!r} on http://localhost:{port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
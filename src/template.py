@@ -0,0 +1,99 @@
+import os
+import re
+from functools import lru_cache
+
+from htmlnode import HTMLNode
+from minify import iter_minified_html, minify_markup
+
+PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+URL_ATTRIBUTES = ("href", "src")
+ROOT_URL = re.compile(r'(href|src)="(/[^"]*)"')
+
+
+class Template:
+    def __init__(self, text, basepath="/", assets=None, minify=False):
+        self.segments = []
+        self.slots = []
+        self.minify = minify
+
+        position = 0
+        for match in PLACEHOLDER.finditer(text):
+            self.segments.append(
+                rewrite_root_urls(text[position : match.start()], basepath, assets)
+            )
+            self.slots.append((match.group(1), match.group(0)))
+            position = match.end()
+        self.segments.append(rewrite_root_urls(text[position:], basepath, assets))
+        if minify:
+            self.segments = [minify_markup(segment) for segment in self.segments]
+
+    def iter_html(self, node: HTMLNode):
+        if self.minify:
+            return iter_minified_html(node)
+        return node.iter_html()
+
+    def render(self, values: dict) -> str:
+        return "".join(self.iter_render(values))
+
+    def iter_render(self, values: dict):
+        yield self.segments[0]
+        for (name, placeholder), segment in zip(self.slots, self.segments[1:]):
+            value = values.get(name, placeholder)
+            if isinstance(value, HTMLNode):
+                yield from self.iter_html(value)
+            else:
+                yield value
+            yield segment
+
+    def write(self, stream, values: dict):
+        stream.write(self.segments[0])
+        for (name, placeholder), segment in zip(self.slots, self.segments[1:]):
+            value = values.get(name, placeholder)
+            if isinstance(value, HTMLNode):
+                stream.writelines(self.iter_html(value))
+            else:
+                stream.write(value)
+            stream.write(segment)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({[name for name, _ in self.slots]})"
+
+
+def rewrite_url(url: str, basepath: str, assets=None) -> str:
+    if assets is not None:
+        url = assets.resolve(url)
+    return basepath + url[1:]
+
+
+def rewrite_root_urls(text: str, basepath: str, assets=None) -> str:
+    if basepath == "/" and assets is None:
+        return text
+    return ROOT_URL.sub(
+        lambda m: f'{m[1]}="{rewrite_url(m[2], basepath, assets)}"', text
+    )
+
+
+def rewrite_node_urls(node: HTMLNode, basepath: str, assets=None):
+    if basepath == "/" and assets is None:
+        return
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.props:
+            for attribute in URL_ATTRIBUTES:
+                url = current.props.get(attribute)
+                if url is not None and url.startswith("/"):
+                    current.props[attribute] = rewrite_url(url, basepath, assets)
+        if current.children:
+            stack.extend(current.children)
+
+
+@lru_cache(maxsize=8)
+def _compile_template(template_path, basepath, mtime_ns, assets, minify):
+    with open(template_path, "r") as t:
+        return Template(t.read(), basepath, assets, minify)
+
+
+def load_template(template_path, basepath="/", assets=None, minify=False) -> Template:
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    return _compile_template(str(template_path), basepath, mtime_ns, assets, minify)
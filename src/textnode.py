@@ -1,6 +1,14 @@
 from enum import Enum
 from leafnode import LeafNode
-import re
+from parentnode import ParentNode
+from grammar import (
+    BOLD_PATTERN,
+    CODE_PATTERN,
+    IMAGE_PATTERN,
+    ITALIC_PATTERN,
+    LINK_PATTERN,
+    grammar,
+)
 
 
 class TextType(Enum):
@@ -13,24 +21,28 @@ class TextType(Enum):
 
 
 class TextTypePatterns(Enum):
-    BOLD = r"\*{2}([^*]+?)\*{2}"
-    ITALIC = r"_([^_]+?)_"
-    CODE = r"`([^*]+?)`"
-    LINK = r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)"
-    IMAGE = r"!\[([^\[\]]*)\]\(([^\(\)]*)\)"
+    BOLD = BOLD_PATTERN
+    ITALIC = ITALIC_PATTERN
+    CODE = CODE_PATTERN
+    LINK = LINK_PATTERN
+    IMAGE = IMAGE_PATTERN
 
 
 class TextNode:
-    def __init__(self, text, text_type, url=None):
+    __slots__ = ("text", "text_type", "url", "children")
+
+    def __init__(self, text, text_type, url=None, children=None):
         self.text = text
         self.text_type = text_type
         self.url = url
+        self.children = children
 
     def __eq__(self, other):
         return (
             self.text == other.text
             and self.text_type == other.text_type
             and self.url == other.url
+            and self.children == other.children
         )
 
     def __repr__(self):
@@ -38,6 +50,9 @@ class TextNode:
 
 
 def text_node_to_html_node(text_node):
+    if text_node.children:
+        return nested_text_node_to_html_node(text_node)
+
     match text_node.text_type:
         case TextType.TEXT:
             return LeafNode(tag=None, value=text_node.text)
@@ -59,6 +74,19 @@ def text_node_to_html_node(text_node):
             raise Exception("Unknown text type")
 
 
+def nested_text_node_to_html_node(text_node):
+    children = [text_node_to_html_node(child) for child in text_node.children]
+    match text_node.text_type:
+        case TextType.BOLD:
+            return ParentNode(tag="b", children=children)
+        case TextType.ITALIC:
+            return ParentNode(tag="i", children=children)
+        case TextType.LINK:
+            return ParentNode(tag="a", children=children, props={"href": text_node.url})
+        case _:
+            raise Exception("Text type cannot contain nested nodes")
+
+
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     results = []
     for node in old_nodes:
@@ -91,7 +119,7 @@ def split_nodes_image(old_nodes):
 
 def split_node_image(node):
     original_text = node.text
-    extracted = extract_markdown(TextTypePatterns.IMAGE.value, original_text)
+    extracted = grammar().image.findall(original_text)
     if not extracted:
         return [node]
 
@@ -122,7 +150,7 @@ def split_nodes_link(old_nodes):
 
 def split_node_link(node):
     original_text = node.text
-    extracted = extract_markdown(TextTypePatterns.LINK.value, original_text)
+    extracted = grammar().link.findall(original_text)
     if not extracted:
         return [node]
 
@@ -145,8 +173,7 @@ def split_node_link(node):
 
 
 def extract_markdown(pattern: str, text: str) -> list[str]:
-    matches = re.findall(pattern, text)
-    return matches
+    return grammar().pattern(pattern).findall(text)
 
 
 def split_nodes(
@@ -179,17 +206,104 @@ def split_nodes(
 
 
 def text_to_textnodes(text: str):
-
-    node = TextNode(
-        text,
-        TextType.TEXT,
-    )
-    n = split_nodes([node], "**", TextType.BOLD, TextTypePatterns.BOLD.value)
-    n = split_nodes(n, "_", TextType.ITALIC, TextTypePatterns.ITALIC.value)
-    n = split_nodes(n, "`", TextType.CODE, TextTypePatterns.CODE.value)
-    n = split_nodes_image(n)
-    n = split_nodes_link(n)
-    return n
+    return scan_inline(text)
+
+
+def scan_inline(text: str, start: int = 0, end: int | None = None) -> list[TextNode]:
+    end = len(text) if end is None else end
+    closers = {}
+    nodes = []
+    search = grammar().inline_markers.search
+
+    text_start = position = start
+    while match := search(text, position, end):
+        index = match.start()
+        token = match_inline_token(text, index, end, closers)
+        if token is None:
+            position = index + 1
+            continue
+
+        node, position = token
+        if text_start < index:
+            nodes.append(TextNode(text[text_start:index], TextType.TEXT))
+        nodes.append(node)
+        text_start = position
+
+    if text_start < end:
+        nodes.append(TextNode(text[text_start:end], TextType.TEXT))
+    return nodes
+
+
+def match_inline_token(text: str, index: int, end: int, closers: dict):
+    match text[index]:
+        case "`":
+            return match_delimited(text, index, end, "`", TextType.CODE, closers)
+        case "*" if text.startswith("**", index):
+            return match_delimited(text, index, end, "**", TextType.BOLD, closers)
+        case "*" | "_" as delimiter:
+            return match_delimited(
+                text, index, end, delimiter, TextType.ITALIC, closers
+            )
+        case "!" if text.startswith("![", index):
+            return match_bracketed(text, index + 1, end, TextType.IMAGE, closers)
+        case "[" if index == 0 or text[index - 1] != "!":
+            return match_bracketed(text, index, end, TextType.LINK, closers)
+    return None
+
+
+def find_closer(text, closer, start, end, closers):
+    searched_from, found = closers.get(closer, (end + 1, -1))
+    if searched_from <= start and (found == -1 or found >= start):
+        return found
+    found = text.find(closer, start, end)
+    closers[closer] = (start, found)
+    return found
+
+
+def match_delimited(text, index, end, delimiter, text_type, closers):
+    content_start = index + len(delimiter)
+    content_end = find_closer(text, delimiter, content_start, end, closers)
+    if content_end == -1:
+        return None
+    if content_end == content_start:
+        return None
+
+    content = text[content_start:content_end]
+    node = TextNode(content, text_type)
+    if text_type != TextType.CODE:
+        node.children = nested_nodes(text, content_start, content_end)
+    return node, content_end + len(delimiter)
+
+
+def match_bracketed(text, index, end, text_type, closers):
+    label_end = find_closer(text, "]", index + 1, end, closers)
+    if label_end == -1:
+        return None
+    if -1 < find_closer(text, "[", index + 1, end, closers) < label_end:
+        return None
+    if label_end + 1 >= end or text[label_end + 1] != "(":
+        return None
+
+    url_start = label_end + 2
+    url_end = find_closer(text, ")", url_start, end, closers)
+    if url_end == -1:
+        return None
+    if -1 < find_closer(text, "(", url_start, end, closers) < url_end:
+        return None
+
+    node = TextNode(text[index + 1 : label_end], text_type, text[url_start:url_end])
+    if text_type == TextType.LINK:
+        node.children = nested_nodes(text, index + 1, label_end)
+    return node, url_end + 1
+
+
+def nested_nodes(text, start, end):
+    if not grammar().inline_markers.search(text, start, end):
+        return None
+    children = scan_inline(text, start, end)
+    if len(children) == 1 and children[0].text_type == TextType.TEXT:
+        return None
+    return children
 
 
 def text_to_children(text: str) -> list[LeafNode]:
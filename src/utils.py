@@ -1,8 +1,33 @@
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
 import os
 
-from blocknode import markdown_to_html_node, extract_title
+from assets import sync_assets
+from blocknode import iter_blocks, iter_html_nodes, title_from_blocks
+from compress import compress_outputs
+from document import (
+    WordCount,
+    front_matter_values,
+    parse_document,
+    read_front_matter,
+    split_front_matter,
+)
+from fingerprint import ASSET_MANIFEST
+from htmlnode import HTMLNode
+from links import collect_links
+from listings import create_listings
+from manifest import hash_file, remove_output
+from minify import minify_html
+from pageindex import page_record
+from parentnode import ParentNode
+from pipeline import BuildPipeline, PipelineError
+from profiling import profile_stage, profiling_enabled
+from template import load_template, rewrite_node_urls
+
+STREAM_THRESHOLD = 32 * 1024 * 1024
 
 
 def delete_directory_content(dest_path: str = "public"):
@@ -12,25 +37,52 @@ def delete_directory_content(dest_path: str = "public"):
         shutil.rmtree(public)
 
 
-def create_public_content(from_path: str = "static", dest_path: str = "public"):
-    home = Path.cwd()
+def create_public_content(
+    from_path: str = "static",
+    dest_path: str = "public",
+    manifest=None,
+    jobs=8,
+    assets=None,
+):
+    previous = manifest.static if manifest is not None else {}
+    rename = assets.mapping if assets is not None else None
+    with profile_stage("copy_static"):
+        synced = sync_assets(from_path, dest_path, previous, jobs, rename=rename)
+    if manifest is not None:
+        manifest.static = synced.files
+    if assets is not None:
+        assets.save(Path(dest_path) / ASSET_MANIFEST)
+    print(
+        f"Synced {from_path} to {dest_path}: {len(synced.copied)} copied, "
+        f"{len(synced.skipped)} unchanged, {len(synced.removed)} removed"
+    )
+    return synced
 
-    for content in os.walk(from_path):
-        content_path = content[0]
-        new_path = content[0].replace(from_path, dest_path, 1)
-        current = home / new_path
-        current.mkdir()
 
-        new_files = content[2]
-        if new_files:
-            for new_file in new_files:
-                shutil.copy(home / content_path / new_file, current)
+def create_compressed_content(dest_path: str = "public", jobs=8):
+    with profile_stage("compress"):
+        result = compress_outputs(dest_path, jobs)
+    print(
+        f"Compressed {dest_path}: {len(result.compressed)} written, "
+        f"{len(result.skipped)} unchanged, {len(result.removed)} removed"
+    )
+    return result
 
 
-def create_html_content_from_md(basepath, from_path, template_path, dest_path):
+class PageGenerationError(Exception):
+    def __init__(self, source):
+        super().__init__(f"Failed to generate page from {source}")
+        self.source = source
+
+
+def collect_pages(from_path, dest_path):
     home = Path.cwd()
+    pages = []
 
-    for content in os.walk(from_path):
+    with profile_stage("walk"):
+        walk = list(os.walk(from_path))
+
+    for content in walk:
         content_path = content[0]
         new_path = content[0].replace(from_path, dest_path, 1)
         current = home / new_path
@@ -39,32 +91,499 @@ def create_html_content_from_md(basepath, from_path, template_path, dest_path):
         new_files = content[2]
         if new_files:
             for new_file in new_files:
-                new_html_file = new_file
-                new_html_file = new_html_file.replace(".md", ".html")
-                generate_page(
+                pages.append(
+                    (home / content_path / new_file, current / html_file_name(new_file))
+                )
+
+    return pages
+
+
+def html_file_name(md_file_name):
+    return md_file_name.replace(".md", ".html")
+
+
+def create_html_content_from_md(
+    basepath,
+    from_path,
+    template_path,
+    dest_path,
+    manifest=None,
+    jobs=1,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    pipeline=False,
+    index=None,
+    listings=None,
+):
+    home = Path.cwd()
+    root = home / from_path
+    pages = collect_pages(from_path, dest_path)
+
+    digests = {}
+    records = {} if index is not None else None
+    fresh = manifest is None or not manifest.pages
+    if manifest is not None or index is not None:
+        known = index.hashes() if index is not None else {}
+        changed = []
+        for source, dest in pages:
+            key = source.relative_to(root).as_posix()
+            digests[key] = hash_file(source)
+            if (
+                manifest is None
+                or manifest.pages.get(key) != digests[key]
+                or not dest.exists()
+                or (index is not None and known.get(key) != digests[key])
+            ):
+                changed.append((source, dest))
+        pages = changed
+
+    if pipeline:
+        small, pages = split_large_pages(pages)
+        if small:
+            render = partial(
+                render_markdown,
+                basepath=basepath,
+                template_path=template_path,
+                cache=cache,
+                assets=assets,
+                minify=minify,
+                collect=links is not None,
+                index=records is not None,
+            )
+            build = BuildPipeline(render, template_path, jobs)
+            try:
+                report = build.run(small)
+            except PipelineError as e:
+                raise PageGenerationError(e.source) from e.error
+            print(report.format())
+            if links is not None:
+                for source, found in build.links.items():
+                    links.add(source.relative_to(root).as_posix(), found)
+            if records is not None:
+                for source, record in build.records.items():
+                    records[source.relative_to(root).as_posix()] = record
+    elif jobs > 1 and len(pages) > 1:
+        small, pages = split_large_pages(pages)
+        if small:
+            results = generate_pages_parallel(
+                basepath,
+                small,
+                template_path,
+                jobs,
+                cache,
+                assets,
+                minify,
+                collect=links is not None,
+                index=records is not None,
+            )
+            for (source, _), (found, record) in zip(small, results):
+                key = source.relative_to(root).as_posix()
+                if links is not None:
+                    links.add(key, found)
+                if records is not None:
+                    records[key] = record
+
+    for source, dest in pages:
+        found = [] if links is not None else None
+        rendered = [] if records is not None else None
+        try:
+            generate_page(
+                basepath,
+                source,
+                template_path,
+                dest,
+                cache,
+                assets,
+                minify,
+                links=found,
+                records=rendered,
+            )
+        except Exception as e:
+            raise PageGenerationError(source) from e
+        key = source.relative_to(root).as_posix()
+        if links is not None:
+            links.add(key, found)
+        if records is not None:
+            records[key] = rendered[0]
+
+    if manifest is not None:
+        for key in set(manifest.pages) - set(digests):
+            stale = home / dest_path / html_file_name(key)
+            remove_output(stale, home / dest_path)
+            del manifest.pages[key]
+            if links is not None:
+                links.remove(key)
+        manifest.pages.update(digests)
+
+    if index is not None:
+        with profile_stage("index"):
+            tags = index.tags()
+            changed = update_page_index(index, root, digests, records)
+        if listings is not None:
+            with profile_stage("listings"):
+                result = create_listings(
                     basepath,
-                    home / content_path / new_file,
                     template_path,
-                    current / new_html_file,
+                    dest_path,
+                    index,
+                    listings,
+                    assets=assets,
+                    minify=minify,
+                    changed=None if fresh else changed,
+                    previous_tags=tags,
                 )
+            print(
+                f"Listings in {dest_path}: {len(result.written)} written, "
+                f"{len(result.skipped)} unchanged, {len(result.removed)} removed"
+            )
 
+    if cache is not None:
+        cache.evict()
+
+
+def update_page_index(index, root, digests, rendered):
+    known = index.hashes()
+    records = []
+    for key, digest in digests.items():
+        if known.get(key) != digest:
+            record = rendered[key]
+            record.path = key
+            record.hash = digest
+            records.append(record)
+    stale = [
+        index.get(key) for key, digest in known.items() if digests.get(key) != digest
+    ]
+    removed = index.update(records, keep=digests.keys())
+    print(
+        f"Indexed {root.name}: {len(records)} updated, "
+        f"{len(digests) - len(records)} unchanged, {len(removed)} removed"
+    )
+    return stale + records
+
+
+def split_large_pages(pages):
+    small = []
+    large = []
+    for source, dest in pages:
+        if os.path.getsize(source) >= STREAM_THRESHOLD:
+            large.append((source, dest))
+        else:
+            small.append((source, dest))
+    return small, large
+
+
+def generate_pages_parallel(
+    basepath,
+    pages,
+    template_path,
+    jobs,
+    cache=None,
+    assets=None,
+    minify=False,
+    collect=False,
+    index=False,
+):
+    chunksize = max(1, len(pages) // (jobs * 4))
+    render = partial(
+        render_collected,
+        basepath=basepath,
+        template_path=template_path,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        collect=collect,
+        index=index,
+    )
+    collected = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(
+            render, [source for source, _ in pages], chunksize=chunksize
+        )
+        for source, dest in pages:
+            try:
+                html, found, record = next(results)
+            except Exception as e:
+                raise PageGenerationError(source) from e
+            collected.append((found, record))
+            print(f"Generating page from {source} to {dest} using {template_path}")
+            write_page(dest, html)
+            print("Finished generating page")
+    return collected
 
-def generate_page(basepath, from_path, template_path, dest_path):
-    print(f"Generating page from {from_path} to {dest_path} using {template_path}")
-    with open(from_path, "r") as f:
-        markdown = f.read()
 
-    with open(template_path, "r") as t:
-        template_file = t.read()
+def prepare_page(
+    basepath,
+    from_path,
+    template_path,
+    metadata=None,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    template = load_template(template_path, basepath, assets, minify)
+    return template, page_values(
+        basepath,
+        from_path,
+        metadata=metadata,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        links=links,
+        records=records,
+    )
 
-    html_title = extract_title(markdown)
-    html_body = markdown_to_html_node(markdown)
 
-    template_file = template_file.replace("{{ Title }}", html_title)
-    template_file = template_file.replace("{{ Content }}", html_body.to_html())
-    template_file = template_file.replace('href="/', f'href="{basepath}')
-    template_file = template_file.replace('src="/', f'src="{basepath}')
+def page_values(
+    basepath,
+    from_path,
+    metadata=None,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    with profile_stage("read", from_path):
+        with open(from_path, "r") as f:
+            markdown = f.read()
 
+    return markdown_values(
+        basepath,
+        markdown,
+        from_path,
+        metadata=metadata,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        links=links,
+        records=records,
+    )
+
+
+def markdown_values(
+    basepath,
+    markdown,
+    from_path=None,
+    metadata=None,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    values = dict(metadata or {})
+    if cache is not None:
+        with profile_stage("cache", from_path):
+            key = cache.key(markdown, basepath, assets, minify)
+            fragment = cache.get(key)
+            cached_links = None
+            if fragment is not None and links is not None:
+                cached_links = cache.get_links(key)
+        if fragment is not None and (links is None or cached_links is not None):
+            if links is not None:
+                links.extend(cached_links)
+            front_matter, body = split_front_matter(markdown)
+            values.update(front_matter_values(front_matter))
+            values["Title"], values["Content"] = fragment
+            if records is not None:
+                records.append(
+                    page_record(front_matter, values["Title"], len(body.split()))
+                )
+            return values
+
+    with profile_stage("parse", from_path):
+        document = parse_document(markdown)
+    values.update(front_matter_values(document.metadata))
+
+    with profile_stage("extract_title", from_path):
+        html_title = document.title
+    if records is not None:
+        records.append(page_record(document.metadata, html_title, document.words))
+
+    with profile_stage("markdown_to_html_node", from_path):
+        html_body = document.to_html_node()
+        if links is not None:
+            page_links = collect_links(html_body, markdown)
+            links.extend(page_links)
+        rewrite_node_urls(html_body, basepath, assets)
+
+    values["Title"] = html_title
+    values["Content"] = html_body
+    if cache is not None:
+        values["Content"] = minify_html(html_body) if minify else html_body.to_html()
+        cache.put(key, html_title, values["Content"])
+        if links is not None:
+            cache.put_links(key, page_links)
+
+    return values
+
+
+def render_page(
+    basepath,
+    from_path,
+    template_path,
+    metadata=None,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    template, values = prepare_page(
+        basepath,
+        from_path,
+        template_path,
+        metadata=metadata,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        links=links,
+        records=records,
+    )
+    return template.render(values)
+
+
+def render_collected(from_path, collect=False, index=False, **options):
+    links = [] if collect else None
+    records = [] if index else None
+    html = render_page(from_path=from_path, links=links, records=records, **options)
+    return html, links, records[0] if index else None
+
+
+def render_markdown(
+    from_path,
+    markdown,
+    basepath,
+    template_path,
+    cache=None,
+    assets=None,
+    minify=False,
+    collect=False,
+    index=False,
+):
+    links = [] if collect else None
+    records = [] if index else None
+    template = load_template(template_path, basepath, assets, minify)
+    values = markdown_values(
+        basepath,
+        markdown,
+        from_path,
+        cache=cache,
+        assets=assets,
+        minify=minify,
+        links=links,
+        records=records,
+    )
+    return template.render(values), links, records[0] if index else None
+
+
+def write_page(dest_path, html):
     with open(dest_path, "w") as d:
-        d.write(template_file)
+        d.write(html)
+
+
+def generate_page(
+    basepath,
+    from_path,
+    template_path,
+    dest_path,
+    cache=None,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    print(f"Generating page from {from_path} to {dest_path} using {template_path}")
+    if cache is None and os.path.getsize(from_path) >= STREAM_THRESHOLD:
+        with profile_stage("page", from_path):
+            stream_page(
+                basepath,
+                from_path,
+                template_path,
+                dest_path,
+                assets,
+                minify,
+                links,
+                records,
+            )
+        print("Finished generating page")
+        return
+
+    with profile_stage("page", from_path):
+        template, values = prepare_page(
+            basepath,
+            from_path,
+            template_path,
+            cache=cache,
+            assets=assets,
+            minify=minify,
+            links=links,
+            records=records,
+        )
+        if profiling_enabled():
+            write_page_profiled(from_path, dest_path, template, values)
+        else:
+            with open(dest_path, "w") as d:
+                template.write(d, values)
     print("Finished generating page")
+
+
+def stream_page(
+    basepath,
+    from_path,
+    template_path,
+    dest_path,
+    assets=None,
+    minify=False,
+    links=None,
+    records=None,
+):
+    template = load_template(template_path, basepath, assets, minify)
+    with open(from_path, "r") as f:
+        metadata = read_front_matter(f)
+        counter = WordCount()
+        blocks = counter.blocks(iter_blocks(f))
+        head = []
+        if metadata.get("title"):
+            title = metadata["title"]
+        else:
+            for block in blocks:
+                head.append(block)
+                if block.text.startswith("# "):
+                    break
+            title = title_from_blocks(block.text for block in head)
+
+        body = ParentNode(
+            "div", stream_html_nodes(chain(head, blocks), basepath, assets, links)
+        )
+        values = front_matter_values(metadata)
+        values["Title"] = title
+        values["Content"] = body
+        with open(dest_path, "w") as d:
+            template.write(d, values)
+    if records is not None:
+        records.append(page_record(metadata, title, counter.words))
+
+
+def stream_html_nodes(block_nodes, basepath, assets=None, links=None):
+    for node in iter_html_nodes(block_nodes):
+        if links is not None:
+            links.extend(collect_links(node))
+        rewrite_node_urls(node, basepath, assets)
+        yield node
+
+
+def write_page_profiled(from_path, dest_path, template, values):
+    with profile_stage("to_html", from_path):
+        if isinstance(values["Content"], HTMLNode):
+            values["Content"] = "".join(template.iter_html(values["Content"]))
+
+    with profile_stage("template", from_path):
+        html = template.render(values)
+
+    with profile_stage("write", from_path):
+        write_page(dest_path, html)
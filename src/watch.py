@@ -0,0 +1,171 @@
+import os
+import sys
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from assets import transfer_file
+from manifest import remove_output
+from template import load_template
+from utils import (
+    collect_pages,
+    create_public_content,
+    delete_directory_content,
+    html_file_name,
+    page_values,
+)
+
+
+def snapshot(*roots) -> dict:
+    files = {}
+    for root in roots:
+        if os.path.isfile(root):
+            stat = os.stat(root)
+            files[str(root)] = (stat.st_mtime_ns, stat.st_size)
+            continue
+        for content in os.walk(root):
+            for name in content[2]:
+                path = os.path.join(content[0], name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def diff_snapshots(old: dict, new: dict) -> set:
+    changed = {path for path, state in new.items() if old.get(path) != state}
+    return changed | (old.keys() - new.keys())
+
+
+class SiteWatcher:
+    def __init__(
+        self,
+        basepath="/",
+        content_path="content",
+        static_path="static",
+        template_path="template.html",
+        dest_path="docs",
+    ):
+        self.basepath = basepath
+        self.content_path = Path(content_path)
+        self.static_path = Path(static_path)
+        self.template_path = Path(template_path)
+        self.dest_path = Path(dest_path)
+        self.pages = {}
+        self.files = {}
+        self.latencies = []
+
+    def build(self):
+        delete_directory_content(dest_path=str(self.dest_path))
+        create_public_content(str(self.static_path), str(self.dest_path))
+        for source, _ in collect_pages(str(self.content_path), str(self.dest_path)):
+            self.render(source)
+        self.files = snapshot(self.content_path, self.static_path, self.template_path)
+
+    def poll(self) -> set:
+        files = snapshot(self.content_path, self.static_path, self.template_path)
+        changed = diff_snapshots(self.files, files)
+        self.files = files
+        return changed
+
+    def rebuild(self, changed: set) -> int:
+        start = time.perf_counter()
+        touched = 0
+        template_changed = False
+
+        for path in sorted(Path(p) for p in changed):
+            if path == self.template_path:
+                template_changed = True
+            elif path.is_relative_to(self.static_path):
+                touched += self.sync_static(path)
+            elif path.is_relative_to(self.content_path):
+                touched += self.sync_page(path)
+
+        if template_changed:
+            for source in self.pages:
+                self.write(source)
+            touched += len(self.pages)
+
+        self.latencies.append(time.perf_counter() - start)
+        return touched
+
+    def sync_static(self, path: Path) -> int:
+        dest = self.dest_path / path.relative_to(self.static_path)
+        if not path.exists():
+            remove_output(dest, self.dest_path)
+            return 1
+        transfer_file(path, dest)
+        return 1
+
+    def sync_page(self, path: Path) -> int:
+        source = path.absolute()
+        if not path.exists():
+            self.pages.pop(source, None)
+            remove_output(self.output_path(source), self.dest_path.absolute())
+            return 1
+        self.render(source)
+        return 1
+
+    def render(self, source: Path):
+        self.pages[source] = page_values(self.basepath, source)
+        self.write(source)
+
+    def write(self, source: Path):
+        dest = self.output_path(source)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        template = load_template(self.template_path, self.basepath)
+        with open(dest, "w") as d:
+            template.write(d, self.pages[source])
+
+    def output_path(self, source: Path) -> Path:
+        relative = source.relative_to(self.content_path.absolute())
+        return (
+            self.dest_path.absolute() / relative.parent / html_file_name(relative.name)
+        )
+
+    def run(self, interval=0.1, debounce=0.05):
+        while True:
+            changed = self.poll()
+            if not changed:
+                time.sleep(interval)
+                continue
+
+            time.sleep(debounce)
+            while more := self.poll():
+                changed |= more
+                time.sleep(debounce)
+
+            try:
+                touched = self.rebuild(changed)
+            except Exception as e:
+                print(f"Rebuild failed: {e}")
+                continue
+            print(f"Rebuilt {touched} file(s) in {self.latencies[-1] * 1000:.1f} ms")
+
+
+def serve(directory, port):
+    handler = partial(SimpleHTTPRequestHandler, directory=directory)
+    server = ThreadingHTTPServer(("", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Serving {directory} on http://localhost:{port}/")
+    return server
+
+
+def main(basepath="/", port=8888, interval=0.1, debounce=0.05):
+    watcher = SiteWatcher(basepath)
+    watcher.build()
+    serve(str(watcher.dest_path), port)
+    try:
+        watcher.run(interval, debounce)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    from cli import run
+
+    raise SystemExit(run(["watch", *sys.argv[1:]]))
@@ -0,0 +1,58 @@
+import io
+import unittest
+
+from src.arena import TAGS, NodeArena, tag_id
+from src.blocknode import markdown_to_html_node
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+from tests.test_blocknode import BLOCK_EXAMPLE, MAJESTY_MARKDOWN
+
+
+class TestTagTable(unittest.TestCase):
+    def test_interned_ids(self):
+        self.assertEqual(0, tag_id(None))
+        self.assertEqual(tag_id("p"), tag_id("p"))
+        self.assertEqual("blockquote", TAGS[tag_id("blockquote")])
+
+
+class TestNodeArena(unittest.TestCase):
+    def test_matches_object_tree(self):
+        for markdown in (BLOCK_EXAMPLE, MAJESTY_MARKDOWN):
+            node = markdown_to_html_node(markdown)
+            arena, root = NodeArena.from_node(node)
+            self.assertEqual(node.to_html(), arena.to_html(root))
+
+    def test_props_and_leaf_kinds(self):
+        node = ParentNode(
+            "p",
+            [
+                LeafNode(None, "text "),
+                LeafNode("a", "link", {"href": "/x"}),
+                LeafNode("img", "", {"src": "/i.png", "alt": "i"}),
+                ParentNode("a", [LeafNode("b", "bold")], {"href": "/y"}),
+            ],
+        )
+        arena, root = NodeArena.from_node(node)
+        self.assertEqual(6, len(arena))
+        stream = io.StringIO()
+        arena.write_html(stream, root)
+        self.assertEqual(node.to_html(), stream.getvalue())
+
+    def test_built_directly(self):
+        arena = NodeArena()
+        first = arena.add("li", "one")
+        second = arena.add("li", "two")
+        root = arena.add("ul", children=[first, second])
+        self.assertEqual("<ul><li>one</li><li>two</li></ul>", arena.to_html(root))
+        self.assertEqual("two", arena.value(second))
+        self.assertIsNone(arena.value(root))
+
+
+class TestSlots(unittest.TestCase):
+    def test_nodes_have_no_instance_dict(self):
+        self.assertFalse(hasattr(LeafNode("b", "x"), "__dict__"))
+        self.assertFalse(hasattr(ParentNode("p", []), "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
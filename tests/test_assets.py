@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from src.assets import is_unchanged, sync_assets, transfer_file
+from src.utils import create_html_content_from_md
+
+
+class TestSyncAssets(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.static = self.root / "static"
+        self.dest = self.root / "docs"
+        (self.static / "images").mkdir(parents=True)
+        (self.static / "index.css").write_text("body {}")
+        (self.static / "images" / "a.png").write_bytes(b"png")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_first_sync_copies_everything(self):
+        result = sync_assets(self.static, self.dest)
+        self.assertEqual(["images/a.png", "index.css"], sorted(result.copied))
+        self.assertEqual(b"png", (self.dest / "images" / "a.png").read_bytes())
+        self.assertEqual({"images/a.png", "index.css"}, set(result.files))
+
+    def test_unchanged_files_are_skipped(self):
+        sync_assets(self.static, self.dest, link=False)
+        result = sync_assets(self.static, self.dest, link=False)
+        self.assertEqual([], result.copied)
+        self.assertEqual(2, len(result.skipped))
+
+    def test_changed_file_is_copied_again(self):
+        sync_assets(self.static, self.dest, link=False)
+        (self.static / "index.css").write_text("body { margin: 0 }")
+        result = sync_assets(self.static, self.dest, link=False)
+        self.assertEqual(["index.css"], result.copied)
+        self.assertEqual("body { margin: 0 }", (self.dest / "index.css").read_text())
+
+    def test_stale_files_are_pruned(self):
+        first = sync_assets(self.static, self.dest)
+        (self.static / "images" / "a.png").unlink()
+        (self.dest / "page.html").write_text("generated page")
+        result = sync_assets(self.static, self.dest, previous=first.files)
+        self.assertEqual(["images/a.png"], result.removed)
+        self.assertFalse((self.dest / "images").exists())
+        self.assertTrue((self.dest / "page.html").exists())
+
+
+class TestTransferFile(unittest.TestCase):
+    def test_copy_preserves_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "a.txt"
+            dest = Path(tmp) / "out" / "a.txt"
+            source.write_text("a")
+            os.utime(source, ns=(0, 10**18))
+            transfer_file(source, dest, link=False)
+            self.assertEqual("a", dest.read_text())
+            self.assertEqual(10**18, dest.stat().st_mtime_ns)
+            self.assertTrue(is_unchanged(source, dest))
+            self.assertTrue(is_unchanged(source, dest, checksum=True))
+
+    def test_hard_link(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "a.txt"
+            dest = Path(tmp) / "b.txt"
+            source.write_text("a")
+            dest.write_text("old")
+            transfer_file(source, dest, link=True)
+            self.assertEqual("a", dest.read_text())
+            self.assertTrue(is_unchanged(source, dest))
+
+    def test_generated_page_does_not_overwrite_static_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            static = root / "static" / "contact" / "index.html"
+            static.parent.mkdir(parents=True)
+            static.write_text("static page")
+            page = root / "content" / "contact" / "index.md"
+            page.parent.mkdir(parents=True)
+            page.write_text("# Contact")
+            (root / "template.html").write_text("{{ Content }}")
+
+            sync_assets(root / "static", root / "docs")
+            with redirect_stdout(StringIO()):
+                create_html_content_from_md(
+                    "/",
+                    str(root / "content"),
+                    root / "template.html",
+                    str(root / "docs"),
+                )
+            self.assertEqual("static page", static.read_text())
+            self.assertIn(
+                "<h1>Contact</h1>",
+                (root / "docs" / "contact" / "index.html").read_text(),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
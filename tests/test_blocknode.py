@@ -1,7 +1,11 @@
+import io
 import unittest
 
 from src.blocknode import (
+    BlockNode,
+    BlockType,
     block_to_block_type,
+    iter_blocks,
     heading_to_html_node,
     markdown_to_blocks,
     markdown_to_html_node,
@@ -133,6 +137,37 @@ This is a paragraph of text. It has some **bold** and *italic* words inside of i
         result = markdown_to_blocks(markdown=markdown)
         self.assertEqual(expected, result)
 
+    def test_fenced_code_keeps_blank_lines(self):
+        markdown = "Intro\n\n```\nfirst\n\n\nsecond\n```\n\nOutro"
+        expected = ["Intro", "```\nfirst\n\n\nsecond\n```", "Outro"]
+        self.assertEqual(expected, markdown_to_blocks(markdown))
+
+    def test_fenced_code_html(self):
+        expected = "<div><pre><code>a = 1\n\nb = 2</code></pre></div>"
+        result = markdown_to_html_node("```\na = 1\n\nb = 2\n```")
+        self.assertEqual(expected, result.to_html())
+
+
+class TestIterBlocks(unittest.TestCase):
+    def test_reads_lines_from_a_file(self):
+        expected = [
+            BlockNode("# Title", BlockType.HEADING),
+            BlockNode("> quoted\n> more", BlockType.QUOTE),
+            BlockNode("* a\n- b", BlockType.UNORDERED_LIST),
+            BlockNode("1. a\n2. b", BlockType.ORDERED_LIST),
+            BlockNode("```\ncode\n```", BlockType.CODE),
+            BlockNode("Plain text\nover two lines", BlockType.PARAGRAPH),
+        ]
+        stream = io.StringIO(
+            "# Title\n\n> quoted\n> more\n\n* a\n- b\n\n\n1. a\n2. b\n\n"
+            "```\ncode\n```\nPlain text\nover two lines\n"
+        )
+        self.assertEqual(expected, list(iter_blocks(stream)))
+
+    def test_types_match_block_to_block_type(self):
+        for block in iter_blocks(BLOCK_EXAMPLE.splitlines()):
+            self.assertEqual(block_to_block_type(block.text), block.block_type)
+
 
 class TestBlockToBlockType(unittest.TestCase):
     def test_paragraph(self):
@@ -0,0 +1,75 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.cache import FragmentCache
+from src.utils import page_values
+
+
+class TestFragmentCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.cache = FragmentCache(self.root / "cache" / "fragments.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_depends_on_source_and_basepath(self):
+        key = FragmentCache.key("# A", "/")
+        self.assertEqual(key, FragmentCache.key("# A", "/"))
+        self.assertNotEqual(key, FragmentCache.key("# B", "/"))
+        self.assertNotEqual(key, FragmentCache.key("# A", "/base/"))
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get("k"))
+        self.cache.put("k", "Title", "<div></div>")
+        self.assertEqual(("Title", "<div></div>"), self.cache.get("k"))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_links_are_stored_beside_fragments(self):
+        self.assertIsNone(self.cache.get_links("k"))
+        self.cache.put_links("k", [("href", "/", 3)])
+        self.assertEqual([("href", "/", 3)], self.cache.get_links("k"))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.max_bytes = 25
+        for key in ("a", "b", "c"):
+            self.cache.put(key, "T", "x" * 9)
+        self.cache.get("a")
+        self.assertEqual(1, self.cache.evict())
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertEqual(20, self.cache.stats()["bytes"])
+
+    def test_clear(self):
+        self.cache.put("k", "Title", "<div></div>")
+        self.cache.clear()
+        self.assertEqual(0, self.cache.stats()["entries"])
+
+    def test_picklable_for_worker_processes(self):
+        self.cache.put("k", "Title", "<div></div>")
+        copy = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(("Title", "<div></div>"), copy.get("k"))
+
+
+class TestCachedPageValues(unittest.TestCase):
+    def test_hit_skips_parsing(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "index.md"
+            source.write_text("# Title\n\nBody")
+            cache = FragmentCache(Path(tmp) / "fragments.sqlite")
+
+            values = page_values("/", source, cache=cache)
+            self.assertEqual("<div><h1>Title</h1><p>Body</p></div>", values["Content"])
+
+            cache.put(cache.key(source.read_text(), "/"), "Cached", "<div>hit</div>")
+            values = page_values("/", source, cache=cache)
+            self.assertEqual("Cached", values["Title"])
+            self.assertEqual("<div>hit</div>", values["Content"])
+
+
+if __name__ == "__main__":
+    unittest.main()
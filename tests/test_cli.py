@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+from src.cli import make_parser, run
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+HEAVY_MODULES = {
+    "blocknode",
+    "textnode",
+    "utils",
+    "main",
+    "template",
+    "cache",
+    "sqlite3",
+    "concurrent.futures",
+    "http.server",
+}
+IMPORT_BUDGET_SHARE = 0.5
+
+
+def import_times(*args) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup(unittest.TestCase):
+    def test_help_does_not_import_the_generator(self):
+        for command in ([], ["build"], ["cache"]):
+            with self.subTest(command=command):
+                times = import_times("src/cli.py", *command, "--help")
+                self.assertEqual(set(), HEAVY_MODULES & times.keys())
+
+    def test_cli_import_stays_within_budget(self):
+        times = import_times("-c", "import cli")
+        self.assertEqual(set(), HEAVY_MODULES & times.keys())
+        generator = import_times("-c", "import utils")["utils"]
+        self.assertLess(times["cli"], generator * IMPORT_BUDGET_SHARE)
+
+
+class TestCommands(unittest.TestCase):
+    def test_build_options(self):
+        arguements = make_parser().parse_args(["build", "/base/", "--jobs", "4"])
+        self.assertEqual("/base/", arguements.basepath)
+        self.assertEqual(4, arguements.jobs)
+        self.assertEqual("build", arguements.command)
+
+    def test_cache_stats(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            out = StringIO()
+            with redirect_stdout(out):
+                status = run(["cache", "stats", "--path", f"{tmp}/f.sqlite"])
+        self.assertEqual(0, status)
+        self.assertIn("entries: 0", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.compress import compress_file, compress_outputs, gzip_bytes
+
+LARGE = "<p>" + "hello world " * 200 + "</p>"
+
+
+class TestCompressOutputs(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "docs"
+        self.manifest = Path(self.tmp.name) / "compressed.json"
+        (self.root / "blog").mkdir(parents=True)
+        (self.root / "index.html").write_text(LARGE)
+        (self.root / "blog" / "post.html").write_text(LARGE)
+        (self.root / "small.css").write_text("body {}")
+        (self.root / "image.png").write_bytes(b"png" * 1000)
+        self.encodings = {".gz": gzip_bytes}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def compress(self):
+        return compress_outputs(
+            self.root, jobs=2, encodings=self.encodings, manifest_path=self.manifest
+        )
+
+    def test_compressible_files_get_gzip_siblings(self):
+        result = self.compress()
+        self.assertEqual(2, len(result.compressed))
+        gz = self.root / "blog" / "post.html.gz"
+        self.assertEqual(LARGE.encode(), gzip.decompress(gz.read_bytes()))
+
+    def test_small_and_binary_files_are_skipped(self):
+        self.compress()
+        self.assertFalse((self.root / "small.css.gz").exists())
+        self.assertFalse((self.root / "image.png.gz").exists())
+
+    def test_unchanged_files_are_not_recompressed(self):
+        self.compress()
+        result = self.compress()
+        self.assertEqual([], result.compressed)
+        self.assertEqual(2, len(result.skipped))
+
+    def test_changed_file_is_recompressed(self):
+        self.compress()
+        (self.root / "index.html").write_text(LARGE + "<p>more</p>")
+        result = self.compress()
+        self.assertEqual([self.root / "index.html.gz"], result.compressed)
+
+    def test_orphaned_compressed_files_are_removed(self):
+        self.compress()
+        (self.root / "blog" / "post.html").unlink()
+        result = self.compress()
+        self.assertEqual([self.root / "blog" / "post.html.gz"], result.removed)
+
+    def test_compressed_files_not_written_here_are_kept(self):
+        data = self.root / "downloads" / "data.csv.gz"
+        data.parent.mkdir()
+        data.write_bytes(gzip_bytes(b"a,b\n"))
+        notes = self.root / "notes.txt.gz"
+        notes.write_bytes(b"shipped as is")
+        (self.root / "notes.txt").write_text(LARGE)
+        self.compress()
+        result = self.compress()
+        self.assertEqual([], result.removed)
+        self.assertTrue(data.exists())
+        self.assertEqual(b"shipped as is", notes.read_bytes())
+
+    def test_file_shrinking_below_threshold_drops_compressed_copy(self):
+        self.compress()
+        path = self.root / "index.html"
+        path.write_text("<p>tiny</p>")
+        written, removed = compress_file(path, encodings=self.encodings)
+        self.assertEqual([], written)
+        self.assertEqual([self.root / "index.html.gz"], removed)
+
+
+if __name__ == "__main__":
+    unittest.main()
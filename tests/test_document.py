@@ -0,0 +1,106 @@
+import unittest
+
+from src.blocknode import markdown_to_html_node
+from src.document import front_matter_values, parse_document, split_front_matter
+
+MARKDOWN = """# The Title
+
+Intro with **bold**.
+
+## First section
+
+- one
+- two
+
+### Deeper
+
+```
+code
+```
+"""
+
+
+class TestDocument(unittest.TestCase):
+    def test_parsed_once(self):
+        document = parse_document(MARKDOWN)
+        self.assertEqual(
+            ["heading", "paragraph", "heading", "unordered_list", "heading", "code"],
+            [block_type.value for block_type in document.block_types],
+        )
+        self.assertEqual({}, document.metadata)
+
+    def test_title_and_headings(self):
+        document = parse_document(MARKDOWN)
+        self.assertEqual("The Title", document.title)
+        self.assertEqual(
+            [(1, "The Title"), (2, "First section"), (3, "Deeper")],
+            document.headings,
+        )
+
+    def test_missing_title_raises(self):
+        document = parse_document("Just a paragraph")
+        with self.assertRaises(Exception):
+            document.title
+
+    def test_html_matches_markdown_to_html_node(self):
+        self.assertEqual(
+            markdown_to_html_node(MARKDOWN).to_html(),
+            parse_document(MARKDOWN).to_html_node().to_html(),
+        )
+
+
+class TestFrontMatter(unittest.TestCase):
+    def test_metadata_is_split_from_body(self):
+        document = parse_document(
+            "---\nDate: 2024-01-02\ntags: [tolkien, 'lore']\n"
+            'summary: "A: B"\n---\n' + MARKDOWN
+        )
+        self.assertEqual(
+            {"date": "2024-01-02", "tags": ["tolkien", "lore"], "summary": "A: B"},
+            document.metadata,
+        )
+        self.assertEqual(
+            parse_document(MARKDOWN).to_html_node().to_html(),
+            document.to_html_node().to_html(),
+        )
+
+    def test_title_comes_from_metadata_first(self):
+        self.assertEqual(
+            "Meta", parse_document("---\ntitle: Meta\n---\n" + MARKDOWN).title
+        )
+        self.assertEqual("The Title", parse_document(MARKDOWN).title)
+
+    def test_unclosed_fence_is_not_front_matter(self):
+        self.assertEqual(({}, "---\ntitle: x\n"), split_front_matter("---\ntitle: x\n"))
+        self.assertEqual(({}, "--- a\n---\n"), split_front_matter("--- a\n---\n"))
+
+    def test_leading_rule_is_not_front_matter(self):
+        markdown = "---\nIntro text\n---\n\n# Title"
+        self.assertEqual(({}, markdown), split_front_matter(markdown))
+        self.assertEqual("Title", parse_document(markdown).title)
+        markdown = "---\ntitle: x\nNot a pair: really\n---\n# Title"
+        self.assertEqual(({}, markdown), split_front_matter(markdown))
+
+    def test_heading_between_rules_is_not_front_matter(self):
+        markdown = "---\n# Welcome\n---\n\nBody"
+        self.assertEqual(({}, markdown), split_front_matter(markdown))
+        markdown = "---\n\n# Welcome\n\n---\n\nBody"
+        self.assertEqual(({}, markdown), split_front_matter(markdown))
+        self.assertEqual("Welcome", parse_document(markdown).title)
+        metadata, body = split_front_matter("---\n# draft\ntitle: x\n---\nBody")
+        self.assertEqual(({"title": "x"}, "Body"), (metadata, body))
+
+    def test_single_tag_becomes_list(self):
+        metadata, body = split_front_matter("---\ntags: notes\n---")
+        self.assertEqual({"tags": ["notes"]}, metadata)
+        self.assertEqual("", body)
+
+    def test_template_values(self):
+        self.assertEqual(
+            {"Date": "2024-01-02", "Tags": "a, b"},
+            front_matter_values({"date": "2024-01-02", "tags": ["a", "b"]}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
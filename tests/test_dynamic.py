@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.dynamic import DynamicSite
+
+TEMPLATE = "<title>{{ Title }}</title><main>{{ Content }}</main>"
+
+
+class TestDynamicSite(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "content" / "blog" / "post").mkdir(parents=True)
+        (self.root / "static").mkdir()
+        (self.root / "content" / "index.md").write_text("# Home\n\n[post](/blog/post)")
+        self.post = self.root / "content" / "blog" / "post" / "index.md"
+        self.post.write_text("# Post\n\nfirst")
+        (self.root / "static" / "index.css").write_text("body {}")
+        (self.root / "template.html").write_text(TEMPLATE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def site(self, **options):
+        return DynamicSite(
+            "/base/",
+            self.root / "content",
+            self.root / "template.html",
+            self.root / "static",
+            **options,
+        )
+
+    def test_renders_pages_on_request(self):
+        site = self.site()
+        self.assertEqual(0, len(site))
+        key, entry = site.resolve("/blog/post/")
+        self.assertEqual("blog/post/index.html", key)
+        self.assertEqual(
+            b"<title>Post</title><main><div><h1>Post</h1><p>first</p></div></main>",
+            entry.body,
+        )
+        self.assertIn(b'href="/base/blog/post"', site.resolve("/")[1].body)
+        self.assertEqual(2, len(site))
+
+    def test_falls_back_to_static_files(self):
+        site = self.site()
+        self.assertEqual(b"body {}", site.resolve("/index.css")[1].body)
+        self.assertEqual((None, None), site.resolve("/missing"))
+        self.assertEqual((None, None), site.resolve("/../content/index.md"))
+
+    def test_repeat_requests_hit_the_cache(self):
+        site = self.site()
+        first = site.resolve("/blog/post")[1]
+        self.assertIs(first, site.resolve("/blog/post/index.html")[1])
+        self.assertEqual(1, site.render.cache_info().hits)
+
+    def test_changed_source_is_rendered_again(self):
+        site = self.site()
+        first = site.resolve("/blog/post")[1]
+        self.post.write_text("# Post\n\nsecond")
+        stat = os.stat(self.post)
+        os.utime(self.post, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = site.resolve("/blog/post")[1]
+        self.assertIn(b"second", second.body)
+        self.assertNotEqual(first.etag, second.etag)
+
+    def test_cache_is_bounded(self):
+        site = self.site(capacity=1)
+        site.resolve("/")
+        site.resolve("/blog/post")
+        self.assertEqual(1, len(site))
+
+
+if __name__ == "__main__":
+    unittest.main()
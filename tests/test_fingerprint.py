@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.fingerprint import AssetManifest, fingerprint_assets, fingerprinted_name
+from src.template import Template, rewrite_node_urls
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+
+MAPPING = {"index.css": "index.0123abcd.css", "images/a.png": "images/a.89abcdef.png"}
+
+
+class TestAssetManifest(unittest.TestCase):
+    def test_fingerprinted_name(self):
+        self.assertEqual(
+            "images/a.0123abcd.png", fingerprinted_name("images/a.png", "0123abcd99")
+        )
+
+    def test_resolve(self):
+        assets = AssetManifest(MAPPING)
+        self.assertEqual("/index.0123abcd.css", assets.resolve("/index.css"))
+        self.assertEqual(
+            "/images/a.89abcdef.png?v=1#top", assets.resolve("/images/a.png?v=1#top")
+        )
+        self.assertEqual("/blog/tom", assets.resolve("/blog/tom"))
+
+    def test_equal_by_content(self):
+        self.assertEqual(AssetManifest(dict(MAPPING)), AssetManifest(dict(MAPPING)))
+        self.assertNotEqual(AssetManifest(MAPPING), AssetManifest({}))
+
+    def test_rewrites_template_and_nodes(self):
+        assets = AssetManifest(MAPPING)
+        template = Template('<link href="/index.css" />{{ Content }}', "/b/", assets)
+        node = ParentNode("p", [LeafNode("img", "", {"src": "/images/a.png"})])
+        rewrite_node_urls(node, "/b/", assets)
+        self.assertEqual(
+            '<link href="/b/index.0123abcd.css" /><p><img src="/b/images/a.89abcdef.png"></p>',
+            template.render({"Content": node}),
+        )
+
+
+class TestFingerprintAssets(unittest.TestCase):
+    def test_hashes_are_cached_by_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            static = Path(tmp) / "static"
+            (static / "images").mkdir(parents=True)
+            (static / "index.css").write_text("body {}")
+            (static / "images" / "a.png").write_bytes(b"png")
+            (static / "page.html").write_text("<p></p>")
+            cache = Path(tmp) / "fingerprints.json"
+
+            assets = fingerprint_assets(static, cache_path=cache)
+            self.assertEqual({"index.css", "images/a.png"}, set(assets.mapping))
+            self.assertRegex(assets.mapping["index.css"], r"^index\.[0-9a-f]{8}\.css$")
+
+            entries = json.loads(cache.read_text())
+            entries["index.css"][2] = "f" * 64
+            cache.write_text(json.dumps(entries))
+            self.assertEqual(
+                "index.ffffffff.css",
+                fingerprint_assets(static, cache_path=cache).mapping["index.css"],
+            )
+
+            os.utime(static / "index.css", ns=(0, 10**18))
+            self.assertEqual(
+                assets.mapping,
+                fingerprint_assets(static, cache_path=cache).mapping,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
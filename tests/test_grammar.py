@@ -0,0 +1,49 @@
+import unittest
+
+from src.grammar import (
+    HEADING,
+    ORDERED_LIST,
+    QUOTE,
+    UNORDERED_LIST,
+    LINK_PATTERN,
+    grammar,
+)
+
+
+class TestGrammar(unittest.TestCase):
+    def test_grammar_is_built_once(self):
+        self.assertIs(grammar(), grammar())
+
+    def test_line_kinds(self):
+        cases = {
+            "# Title": HEADING,
+            "###### Six": HEADING,
+            "####### Seven": None,
+            "#hashtag": None,
+            "> quote": QUOTE,
+            "* item": UNORDERED_LIST,
+            "- item": UNORDERED_LIST,
+            "-item": None,
+            "**bold** start": None,
+            "12. twelfth": ORDERED_LIST,
+            "12 apples": None,
+            "1.5 litres": None,
+            "plain text": None,
+            "": None,
+        }
+        for line, kind in cases.items():
+            with self.subTest(line=line):
+                self.assertEqual(kind, grammar().line_kind(line))
+
+    def test_is_fence(self):
+        self.assertTrue(grammar().is_fence("  ```python"))
+        self.assertFalse(grammar().is_fence("`` not a fence"))
+
+    def test_pattern_reuses_compiled_patterns(self):
+        self.assertIs(grammar().link, grammar().pattern(LINK_PATTERN))
+        custom = grammar().pattern(r"~~(.+?)~~")
+        self.assertIs(custom, grammar().pattern(r"~~(.+?)~~"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.blocknode import markdown_to_html_node
+from src.links import LinkGraph, collect_links, resolves
+from src.utils import create_html_content_from_md
+
+MARKDOWN = """# Title
+
+[Home](/) and [out](https://boot.dev)
+
+![img](/images/a.png)
+
+- [Post](/blog/post#top)
+"""
+
+
+class TestCollectLinks(unittest.TestCase):
+    def test_collects_root_relative_urls_in_document_order(self):
+        node = markdown_to_html_node(MARKDOWN)
+        self.assertEqual(
+            [
+                ("href", "/", 3),
+                ("src", "/images/a.png", 5),
+                ("href", "/blog/post#top", 7),
+            ],
+            collect_links(node, MARKDOWN),
+        )
+
+    def test_without_markdown_lines_are_unknown(self):
+        node = markdown_to_html_node(MARKDOWN)
+        self.assertEqual([None] * 3, [line for _, _, line in collect_links(node)])
+
+
+class TestLinkGraph(unittest.TestCase):
+    def test_resolves_pages_and_assets(self):
+        targets = {"index.html", "blog/post/index.html", "images/a.png"}
+        self.assertTrue(resolves("/", targets))
+        self.assertTrue(resolves("/blog/post", targets))
+        self.assertTrue(resolves("/blog/post/?page=2#top", targets))
+        self.assertTrue(resolves("/images/a.png", targets))
+        self.assertFalse(resolves("/images/b.png", targets))
+        self.assertFalse(resolves("/blog", targets))
+
+    def test_broken_links_are_sorted_by_location(self):
+        graph = LinkGraph()
+        graph.add("b.md", [("href", "/missing", 4)])
+        graph.add("a.md", [("src", "/gone.png", 9), ("href", "/", 1)])
+        self.assertEqual(
+            [("a.md", 9, "src", "/gone.png"), ("b.md", 4, "href", "/missing")],
+            graph.broken({"index.html"}),
+        )
+        self.assertEqual({"a.md"}, graph.inbound()["/"])
+
+
+class TestBuildCollectsLinks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text("{{ Title }}{{ Content }}")
+        for i in range(4):
+            page = self.root / "content" / f"post{i}"
+            page.mkdir(parents=True)
+            (page / "index.md").write_text(f"# Post {i}\n\n[next](/post{i + 1})")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, jobs):
+        graph = LinkGraph()
+        create_html_content_from_md(
+            "/base/",
+            str(self.root / "content"),
+            self.template,
+            str(self.root / f"out{jobs}"),
+            jobs=jobs,
+            links=graph,
+        )
+        return graph
+
+    def test_serial_and_parallel_graphs_match(self):
+        serial = self.build(jobs=1)
+        self.assertEqual(serial.links, self.build(jobs=3).links)
+        targets = {f"post{i}/index.html" for i in range(4)}
+        self.assertEqual(
+            [("post3/index.md", 3, "href", "/post4")], serial.broken(targets)
+        )
+
+    def test_save_writes_broken_links(self):
+        path = self.root / "graph.json"
+        self.build(jobs=1).save(path, set())
+        data = json.loads(path.read_text())
+        self.assertEqual(4, len(data["pages"]))
+        self.assertEqual(4, len(data["broken"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
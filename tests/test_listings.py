@@ -0,0 +1,209 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.listings import (
+    collect_listings,
+    create_listings,
+    listing_path,
+    page_url,
+    paginate,
+    tag_slug,
+    tag_slugs,
+)
+from src.pageindex import PageIndex, PageRecord
+
+TEMPLATE = "<title>{{ Title }}</title>{{ Content }}"
+
+
+def post(number, tags=("news",), title=None):
+    return PageRecord(
+        f"blog/post{number:02}/index.md",
+        title or f"Post {number}",
+        f"2024-01-{number:02}",
+        list(tags),
+        10,
+        f"hash{number}",
+    )
+
+
+class TestPaths(unittest.TestCase):
+    def test_page_urls(self):
+        self.assertEqual("/", page_url("index.md"))
+        self.assertEqual("/blog/tom/", page_url("blog/tom/index.md"))
+        self.assertEqual("/about.html", page_url("about.md"))
+        self.assertEqual("blog/index.html", listing_path("blog"))
+        self.assertEqual("blog/page/3/index.html", listing_path("blog", 3))
+
+    def test_tag_slugs_stay_inside_tags(self):
+        self.assertEqual("c-c", tag_slug("C/C++"))
+        self.assertEqual("etc", tag_slug("../../etc"))
+        self.assertEqual("hello-world", tag_slug("Hello World?"))
+        self.assertEqual("creme-brulee", tag_slug("Crème Brûlée"))
+        self.assertEqual("tag", tag_slug("???"))
+
+    def test_colliding_tags_get_distinct_slugs(self):
+        self.assertEqual(
+            {"c": "c", "c-2": "c-2", "C": "c-3", "C++": "c-4"},
+            tag_slugs(["C++", "c-2", "C", "c"]),
+        )
+        records = [post(1, ["C"]), post(2, ["C++"])]
+        paths = [page.path for page in collect_listings(records)]
+        self.assertIn("tags/c/index.html", paths)
+        self.assertIn("tags/c-2/index.html", paths)
+
+    def test_paginate(self):
+        pages = paginate("blog", "Blog", list(range(25)), size=10)
+        self.assertEqual([10, 10, 5], [len(page.records) for page in pages])
+        self.assertEqual("Blog - page 3", pages[2].title)
+        self.assertEqual(1, len(paginate("blog", "Blog", [])))
+
+    def test_collect_sections_and_tags(self):
+        records = [
+            post(1, ["Middle Earth"]),
+            post(2, []),
+            PageRecord("blog/index.md", "Blog", None, ["x"], 1, "h"),
+            PageRecord("contact/index.md", "Contact", None, ["x"], 1, "h"),
+        ]
+        paths = [page.path for page in collect_listings(records)]
+        self.assertEqual(
+            [
+                "blog/index.html",
+                "tags/middle-earth/index.html",
+                "tags/x/index.html",
+                "tags/index.html",
+            ],
+            paths,
+        )
+        self.assertEqual(2, len(collect_listings(records)[0].records))
+
+
+class TestCreateListings(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        self.dest = self.root / "docs"
+        self.index = PageIndex(self.root / "pages.sqlite")
+        self.index.update(
+            [
+                post(number, ["news"] if number % 2 else ["old"])
+                for number in range(1, 26)
+            ]
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create(self, **options):
+        return create_listings(
+            "/base/", self.template, self.dest, self.index, size=10, **options
+        )
+
+    def change(self, *records):
+        tags = self.index.tags()
+        changed = [self.index.get(record.path) for record in records]
+        self.index.update(records)
+        return self.create(changed=[*changed, *records], previous_tags=tags)
+
+    def test_pages_are_paginated_newest_first(self):
+        result = self.create()
+        self.assertEqual(3 + 2 + 2 + 1, len(result.written))
+        first = (self.dest / "blog" / "index.html").read_text()
+        self.assertIn(
+            '<a href="/base/blog/post25/">Post 25</a> <time>2024-01-25', first
+        )
+        self.assertIn('href="/base/blog/page/2/">Older</a>', first)
+        self.assertIn(
+            '<a href="/base/tags/news/">news</a> (13)',
+            (self.dest / "tags" / "index.html").read_text(),
+        )
+
+    def test_only_affected_listings_are_rewritten(self):
+        self.create()
+        self.index.update([post(3, ["news"], title="Renamed")])
+        result = self.create()
+        self.assertEqual(
+            ["blog/page/3/index.html", "tags/news/page/2/index.html"],
+            sorted(result.written),
+        )
+        self.assertIn(
+            "Renamed", (self.dest / "blog" / "page" / "3" / "index.html").read_text()
+        )
+
+    def test_unaffected_listings_are_not_rendered(self):
+        self.create()
+        result = self.change(post(3, ["news"], title="Renamed"))
+        self.assertEqual(
+            ["blog/page/3/index.html", "tags/news/page/2/index.html"],
+            sorted(result.written),
+        )
+        self.assertEqual(3 + 2 + 1, len(result.written) + len(result.skipped))
+        self.assertIn(
+            "Renamed", (self.dest / "blog" / "page" / "3" / "index.html").read_text()
+        )
+
+    def test_dropped_tag_listing_is_removed(self):
+        self.index.update([post(1, ["solo"])])
+        self.create()
+        result = self.change(post(1, ["news"]))
+        self.assertEqual(["tags/solo/index.html"], result.removed)
+        self.assertFalse((self.dest / "tags" / "solo").exists())
+        self.assertNotIn("solo", (self.dest / "tags" / "index.html").read_text())
+
+    def test_reassigned_slugs_are_rendered_again(self):
+        self.index.update([post(1, ["C"])])
+        self.create()
+        self.assertIn(
+            "Tagged C<", (self.dest / "tags" / "c" / "index.html").read_text()
+        )
+        result = self.change(post(2, ["c"]))
+        self.assertIn("tags/c-2/index.html", result.written)
+        self.assertIn(
+            "Tagged c<", (self.dest / "tags" / "c" / "index.html").read_text()
+        )
+        self.assertIn(
+            "Tagged C<", (self.dest / "tags" / "c-2" / "index.html").read_text()
+        )
+        self.assertEqual(self.create().written, [])
+
+    def test_missing_listing_files_are_written_again(self):
+        self.create()
+        (self.dest / "tags" / "old" / "index.html").unlink()
+        result = self.change(post(3, ["news"], title="Renamed"))
+        self.assertIn("tags/old/index.html", result.written)
+        self.assertEqual(8, len(result.written) + len(result.skipped))
+
+    def test_changed_sections_rebuild_every_listing(self):
+        self.create()
+        result = self.create(changed=[], previous_tags=self.index.tags(), sections=())
+        self.assertIn("blog/index.html", result.removed)
+        self.assertFalse((self.dest / "blog" / "index.html").exists())
+        self.assertEqual([], self.create(changed=[], sections=()).written)
+
+    def test_stale_listings_are_removed(self):
+        self.create()
+        self.index.update([], keep={post(n).path for n in range(1, 11)})
+        result = self.create()
+        self.assertIn("blog/page/3/index.html", result.removed)
+        self.assertFalse((self.dest / "blog" / "page" / "3").exists())
+
+    def test_tag_listings_are_written_under_tags(self):
+        self.index.update([post(1, ["../../etc", "Hello World?"])])
+        result = self.create()
+        self.assertIn("tags/etc/index.html", result.written)
+        self.assertIn("tags/hello-world/index.html", result.written)
+        self.assertFalse((self.root / "etc").exists())
+        self.assertIn(
+            'href="/base/tags/hello-world/"',
+            (self.dest / "tags" / "index.html").read_text(),
+        )
+
+    def test_written_content_pages_win(self):
+        self.index.update([PageRecord("blog/index.md", "Blog", None, [], 1, "h")])
+        self.assertNotIn("blog/index.html", self.create().written)
+
+
+if __name__ == "__main__":
+    unittest.main()
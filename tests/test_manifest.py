@@ -0,0 +1,100 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import src.manifest
+from src.manifest import BuildManifest, generator_version, hash_file
+from src.utils import create_html_content_from_md, create_public_content
+
+TEMPLATE = "<title>{{ Title }}</title><body>{{ Content }}</body>"
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "content" / "blog").mkdir(parents=True)
+        (self.root / "static").mkdir()
+        (self.root / "content" / "index.md").write_text("# Home\n\nHello")
+        (self.root / "content" / "blog" / "index.md").write_text("# Blog\n\nPosts")
+        (self.root / "static" / "index.css").write_text("body {}")
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        self.manifest = BuildManifest("/", hash_file(self.template))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self):
+        create_public_content(
+            str(self.root / "static"), str(self.root / "docs"), manifest=self.manifest
+        )
+        create_html_content_from_md(
+            "/",
+            str(self.root / "content"),
+            self.template,
+            str(self.root / "docs"),
+            manifest=self.manifest,
+        )
+
+    def test_unchanged_pages_are_skipped(self):
+        self.build()
+        index = self.root / "docs" / "index.html"
+        index.write_text("untouched")
+        self.build()
+        self.assertEqual("untouched", index.read_text())
+
+    def test_changed_page_is_rebuilt(self):
+        self.build()
+        (self.root / "content" / "index.md").write_text("# Home\n\nChanged")
+        self.build()
+        self.assertIn("Changed", (self.root / "docs" / "index.html").read_text())
+
+    def test_removed_sources_delete_outputs(self):
+        self.build()
+        (self.root / "content" / "blog" / "index.md").unlink()
+        (self.root / "static" / "index.css").unlink()
+        self.build()
+        self.assertFalse((self.root / "docs" / "blog").exists())
+        self.assertFalse((self.root / "docs" / "index.css").exists())
+        self.assertEqual(["index.md"], list(self.manifest.pages))
+        self.assertEqual({}, self.manifest.static)
+
+    def test_manifest_round_trip(self):
+        self.build()
+        path = self.root / "manifest.json"
+        self.manifest.save(path)
+        loaded = BuildManifest.load(path)
+        self.assertTrue(loaded.is_current("/", hash_file(self.template)))
+        self.assertFalse(loaded.is_current("/other/", hash_file(self.template)))
+        self.assertEqual(self.manifest.pages, loaded.pages)
+
+    def test_manifest_from_another_generator_is_stale(self):
+        template_hash = hash_file(self.template)
+        old = BuildManifest("/", template_hash, version="0.1.0")
+        self.assertFalse(old.is_current("/", template_hash))
+        self.assertTrue(
+            BuildManifest("/", template_hash).is_current("/", template_hash)
+        )
+
+    def test_version_follows_generator_sources(self):
+        source = self.root / "src"
+        source.mkdir()
+        (source / "textnode.py").write_text("A = 1\n")
+        with mock.patch.object(src.manifest, "SOURCE_PATH", source):
+            generator_version.cache_clear()
+            before = generator_version()
+            (source / "textnode.py").write_text("A = 2\n")
+            generator_version.cache_clear()
+            after = generator_version()
+        generator_version.cache_clear()
+        self.assertNotEqual(before, after)
+        self.assertTrue(after.startswith(src.manifest.GENERATOR_VERSION + "+"))
+
+    def test_missing_manifest(self):
+        self.assertIsNone(BuildManifest.load(self.root / "missing.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
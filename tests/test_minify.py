@@ -0,0 +1,79 @@
+import unittest
+
+from src.leafnode import LeafNode
+from src.minify import minify_html, minify_markup
+from src.parentnode import ParentNode
+
+
+class TestMinifyHtml(unittest.TestCase):
+    def test_list_items_drop_closing_tags(self):
+        node = ParentNode(
+            "ul", [ParentNode("li", [LeafNode(None, "a")]), LeafNode("li", "b")]
+        )
+        self.assertEqual("<ul><li>a<li>b</ul>", minify_html(node))
+
+    def test_paragraph_closes_before_block_or_parent_end(self):
+        node = ParentNode(
+            "div",
+            [
+                ParentNode("p", [LeafNode(None, "one")]),
+                ParentNode("p", [LeafNode(None, "two")]),
+                LeafNode("h2", "Heading"),
+            ],
+        )
+        self.assertEqual("<div><p>one<p>two<h2>Heading</h2></div>", minify_html(node))
+
+    def test_paragraph_keeps_closing_tag_inside_link(self):
+        node = ParentNode("a", [ParentNode("p", [LeafNode(None, "x")])], {"href": "/"})
+        self.assertEqual('<a href="/"><p>x</p></a>', minify_html(node))
+
+    def test_text_whitespace_is_collapsed(self):
+        node = ParentNode(
+            "p", [LeafNode(None, "a  \n b "), LeafNode("b", "c"), LeafNode(None, " ")]
+        )
+        self.assertEqual("<p>a b <b>c</b> ", minify_html(node))
+
+    def test_whitespace_between_blocks_is_dropped(self):
+        node = ParentNode("div", [LeafNode(None, "\n  "), LeafNode("h1", "Title")])
+        self.assertEqual("<div><h1>Title</h1></div>", minify_html(node))
+
+    def test_pre_and_code_are_preserved(self):
+        code = "def f():\n    return  1\n"
+        node = ParentNode(
+            "div",
+            [
+                ParentNode("pre", [LeafNode("code", code)]),
+                ParentNode("p", [LeafNode("code", "a  b")]),
+            ],
+        )
+        self.assertEqual(
+            f"<div><pre><code>{code}</code></pre><p><code>a  b</code></div>",
+            minify_html(node),
+        )
+
+
+class TestMinifyMarkup(unittest.TestCase):
+    def test_indentation_and_self_closing_slashes_are_removed(self):
+        text = '<head>\n  <meta charset="utf-8" />\n</head>\n\n<body>\n'
+        self.assertEqual(
+            '<head><meta charset="utf-8"></head><body>', minify_markup(text)
+        )
+
+    def test_pre_blocks_in_template_are_untouched(self):
+        text = "<div>\n  <pre>a\n  b</pre>\n</div>"
+        self.assertEqual("<div><pre>a\n  b</pre></div>", minify_markup(text))
+
+    def test_raw_text_elements_in_template_are_untouched(self):
+        for text in (
+            "<script>\n// hi\nx()\n</script>",
+            '<style type="text/css">\na  {}\n</style>',
+            "<textarea>\n  keep  this\n</textarea>",
+        ):
+            with self.subTest(text=text):
+                self.assertEqual(
+                    f"<p>{text}</p>", minify_markup(f"<p>\n  {text}\n</p>")
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
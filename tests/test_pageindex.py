@@ -0,0 +1,200 @@
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import src.utils
+from src.cache import FragmentCache
+from src.manifest import BuildManifest, hash_file
+from src.pageindex import PageIndex, PageRecord
+from src.utils import create_html_content_from_md
+
+TEMPLATE = "<title>{{ Title }}</title><time>{{ Date }}</time>{{ Content }}"
+
+
+def record(path, date=None, tags=(), title="T", words=1):
+    return PageRecord(path, title, date, list(tags), words, f"hash-{path}")
+
+
+class TestPageIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.index = PageIndex(Path(self.tmp.name) / "pages.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_query_by_tag_and_date(self):
+        self.index.update(
+            [
+                record("a.md", "2024-01-01", ["x"]),
+                record("b.md", "2024-03-01", ["x", "y"]),
+                record("c.md", "2024-02-01", ["y"]),
+            ]
+        )
+        self.assertEqual(
+            ["b.md", "c.md", "a.md"], [page.path for page in self.index.pages()]
+        )
+        self.assertEqual(
+            ["a.md", "b.md"],
+            [page.path for page in self.index.pages("x", descending=False)],
+        )
+        self.assertEqual(
+            ["c.md"], [p.path for p in self.index.pages(limit=1, offset=1)]
+        )
+        self.assertEqual({"x": 2, "y": 2}, self.index.tags())
+        self.assertEqual(["x", "y"], self.index.get("b.md").tags)
+
+    def test_update_replaces_and_prunes(self):
+        self.index.update([record("a.md", tags=["x"]), record("b.md")])
+        removed = self.index.update([record("a.md", tags=["z"])], keep={"a.md"})
+        self.assertEqual(["b.md"], removed)
+        self.assertEqual(1, len(self.index))
+        self.assertEqual({"z": 1}, self.index.tags())
+        self.assertIsNone(self.index.get("b.md"))
+
+    def test_unknown_order_raises(self):
+        with self.assertRaises(ValueError):
+            self.index.pages(order="path; DROP TABLE pages")
+
+
+class TestBuildIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        self.content = self.root / "content"
+        (self.content / "post").mkdir(parents=True)
+        self.post = self.content / "post" / "index.md"
+        self.post.write_text(
+            "---\ndate: 2024-05-01\ntags: [tolkien]\n---\n# Post\n\nThree more words"
+        )
+        (self.content / "index.md").write_text("# Home\n\nWelcome")
+        self.index = PageIndex(self.root / "pages.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, **options):
+        output = StringIO()
+        with redirect_stdout(output):
+            create_html_content_from_md(
+                "/",
+                str(self.content),
+                self.template,
+                str(self.root / "docs"),
+                index=self.index,
+                **options,
+            )
+        return output.getvalue()
+
+    def test_record_from_front_matter(self):
+        self.build()
+        self.assertEqual(
+            PageRecord(
+                "post/index.md",
+                "Post",
+                "2024-05-01",
+                ["tolkien"],
+                5,
+                hash_file(self.post),
+                {"date": "2024-05-01", "tags": ["tolkien"]},
+            ),
+            self.index.get("post/index.md"),
+        )
+
+    def test_title_matches_rendered_page(self):
+        self.post.write_text("```\n# comment\n```\n\n# Real Title\n\nBody")
+        self.build()
+        self.assertEqual("Real Title", self.index.get("post/index.md").title)
+        self.assertIn(
+            "<title>Real Title</title>",
+            (self.root / "docs" / "post" / "index.html").read_text(),
+        )
+
+    def test_rendered_records_match_source(self):
+        self.post.write_text(
+            "---\ntags: [lore]\n---\n```\n# comment\n```\n\n# Post\n\nThree words"
+        )
+        expected = PageRecord(
+            "post/index.md",
+            "Post",
+            None,
+            ["lore"],
+            8,
+            hash_file(self.post),
+            {"tags": ["lore"]},
+        )
+        cache = FragmentCache(self.root / "fragments.sqlite")
+        builds = {
+            "serial": {},
+            "parallel": {"jobs": 2},
+            "pipeline": {"pipeline": True},
+            "cache miss": {"cache": cache},
+            "cache hit": {"cache": cache},
+        }
+        for name, options in builds.items():
+            with self.subTest(name):
+                self.index.clear()
+                self.build(**options)
+                self.assertEqual(expected, self.index.get("post/index.md"))
+        with self.subTest("stream"), mock.patch.object(
+            src.utils, "STREAM_THRESHOLD", 0
+        ):
+            self.index.clear()
+            self.build()
+            self.assertEqual(expected, self.index.get("post/index.md"))
+
+    def test_stale_index_entries_are_rendered_again(self):
+        manifest = BuildManifest("/", hash_file(self.template))
+        self.build(manifest=manifest)
+        self.assertIn("0 updated, 2 unchanged", self.build(manifest=manifest))
+        self.index.clear()
+        self.assertIn("2 updated, 0 unchanged", self.build(manifest=manifest))
+        self.assertEqual("Post", self.index.get("post/index.md").title)
+
+    def test_incremental_build_renders_affected_listings(self):
+        manifest = BuildManifest("/", hash_file(self.template))
+        options = {"manifest": manifest, "listings": ("post",)}
+        self.assertIn("2 written, 0 unchanged, 0 removed", self.build(**options))
+        (self.content / "index.md").write_text("# Home\n\nChanged")
+        self.assertIn("0 written, 0 unchanged, 0 removed", self.build(**options))
+        self.post.write_text("---\ntags: [lore]\n---\n# Post")
+        self.assertIn("2 written, 0 unchanged, 1 removed", self.build(**options))
+        self.assertTrue((self.root / "docs" / "tags" / "lore" / "index.html").exists())
+        self.assertFalse((self.root / "docs" / "tags" / "tolkien").exists())
+
+    def test_listings_enabled_on_an_up_to_date_build(self):
+        manifest = BuildManifest("/", hash_file(self.template))
+        self.build(manifest=manifest)
+        self.assertIn(
+            "2 written, 0 unchanged, 0 removed",
+            self.build(manifest=manifest, listings=("post",)),
+        )
+        self.assertTrue(
+            (self.root / "docs" / "tags" / "tolkien" / "index.html").exists()
+        )
+        self.assertTrue((self.root / "docs" / "tags" / "index.html").exists())
+
+    def test_build_indexes_pages_incrementally(self):
+        self.assertIn("2 updated, 0 unchanged", self.build())
+        self.assertEqual(["tolkien"], self.index.get("post/index.md").tags)
+        self.assertIn(
+            "<time>2024-05-01</time>",
+            (self.root / "docs" / "post" / "index.html").read_text(),
+        )
+
+        self.post.write_text("---\ntags: [lore]\n---\n# Post")
+        self.assertIn("1 updated, 1 unchanged, 0 removed", self.build())
+        self.assertEqual({"lore": 1}, self.index.tags())
+
+        (self.content / "index.md").unlink()
+        self.assertIn("0 updated, 1 unchanged, 1 removed", self.build())
+        self.assertEqual(["post/index.md"], [p.path for p in self.index.pages()])
+
+
+if __name__ == "__main__":
+    unittest.main()
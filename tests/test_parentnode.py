@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from src.parentnode import ParentNode
@@ -48,3 +49,24 @@ class TestLeafNode(unittest.TestCase):
             ],
         )
         self.assertEqual(expected, node.to_html())
+
+    def test_write_html_streams_chunks(self):
+        node = ParentNode(
+            "div",
+            [
+                ParentNode("p", [LeafNode(None, "a"), LeafNode("b", "b")]),
+                LeafNode("img", "", {"src": "/x.png"}),
+            ],
+        )
+        stream = io.StringIO()
+        node.write_html(stream)
+        self.assertEqual(node.to_html(), stream.getvalue())
+        self.assertEqual(
+            ["<div>", "<p>", "a", "<b>b</b>", "</p>", '<img src="/x.png">', "</div>"],
+            list(node.iter_html()),
+        )
+
+    def test_missing_children_raises_when_iterated(self):
+        node = ParentNode("p", None)
+        with self.assertRaises(ValueError):
+            node.to_html()
@@ -0,0 +1,82 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.pipeline import BuildPipeline, PipelineError
+from src.utils import PageGenerationError, create_html_content_from_md
+
+TEMPLATE = "<title>{{ Title }}</title><body>{{ Content }}</body>"
+
+
+def shout(source, markdown):
+    if "fail" in markdown:
+        raise ValueError(source)
+    return markdown.upper(), None, None
+
+
+class TestBuildPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.pages = []
+        for i in range(40):
+            source = self.root / f"page{i}.md"
+            source.write_text(f"page {i}")
+            self.pages.append((source, self.root / f"page{i}.html"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_every_page_is_written_and_counted(self):
+        for jobs in (1, 2):
+            report = BuildPipeline(shout, "t", jobs, depth=4, batch=3).run(self.pages)
+            self.assertEqual([40, 40, 40], [stage.items for stage in report.stages])
+            self.assertEqual("PAGE 7", self.pages[7][1].read_text())
+            self.assertIn("write", report.format())
+
+    def test_failure_names_the_source(self):
+        self.pages[13][0].write_text("fail")
+        for jobs in (1, 2):
+            with self.assertRaises(PipelineError) as cm:
+                BuildPipeline(shout, "t", jobs, depth=4, batch=3).run(self.pages)
+            self.assertEqual(self.pages[13][0], cm.exception.source)
+
+
+class TestPipelinedBuild(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        for i in range(8):
+            page = self.root / "content" / f"post{i}"
+            page.mkdir(parents=True)
+            (page / "index.md").write_text(f"# Post {i}\n\n- [link](/post{i})")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, dest, **kwargs):
+        create_html_content_from_md(
+            "/base/", str(self.root / "content"), self.template, dest, **kwargs
+        )
+        return {p.relative_to(dest): p.read_bytes() for p in Path(dest).rglob("*.html")}
+
+    def test_pipeline_output_matches_serial(self):
+        serial = self.build(str(self.root / "serial"))
+        for jobs in (1, 3):
+            pipelined = self.build(
+                str(self.root / f"pipeline{jobs}"), jobs=jobs, pipeline=True
+            )
+            self.assertEqual(serial, pipelined)
+
+    def test_errors_name_the_source_file(self):
+        broken = self.root / "content" / "post5" / "index.md"
+        broken.write_text("No title here")
+        with self.assertRaises(PageGenerationError) as cm:
+            self.build(str(self.root / "out"), pipeline=True)
+        self.assertEqual(broken, cm.exception.source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+# Imported by their top-level names so the profiler hook is the one utils uses.
+from profiling import BuildProfiler, profile_build, profile_stage, profiling_enabled
+from utils import generate_page
+
+
+class TestBuildProfiler(unittest.TestCase):
+    def test_stage_totals_and_slowest_pages(self):
+        profiler = BuildProfiler()
+        for page in ("a.md", "b.md"):
+            with profiler.stage("page", page):
+                with profiler.stage("read", page):
+                    pass
+        self.assertEqual({"read"}, set(profiler.stage_totals()))
+        self.assertEqual(2, profiler.stage_totals()["read"][2])
+        self.assertEqual(1, len(profiler.slowest_pages(1)))
+        self.assertIn("Slowest 2 page(s):", profiler.report())
+
+    def test_disabled_by_default(self):
+        self.assertFalse(profiling_enabled())
+        with profile_stage("read"):
+            pass
+
+
+class TestProfileBuild(unittest.TestCase):
+    def test_profiled_page_generation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "index.md").write_text("# Title\n\nSome **text**")
+            (root / "template.html").write_text("<h1>{{ Title }}</h1>{{ Content }}")
+            trace = root / "trace.json"
+            stats = root / "build.stats"
+
+            profiler = profile_build(
+                lambda: generate_page(
+                    "/", root / "index.md", root / "template.html", root / "index.html"
+                ),
+                trace_path=trace,
+                stats_path=stats,
+            )
+
+            self.assertFalse(profiling_enabled())
+            self.assertEqual(
+                "<h1>Title</h1><div><h1>Title</h1><p>Some <b>text</b></p></div>",
+                (root / "index.html").read_text(),
+            )
+            self.assertEqual(
+                {
+                    "read",
+                    "parse",
+                    "extract_title",
+                    "markdown_to_html_node",
+                    "to_html",
+                    "template",
+                    "write",
+                },
+                set(profiler.stage_totals()),
+            )
+            events = json.loads(trace.read_text())["traceEvents"]
+            self.assertEqual(8, len(events))
+            self.assertTrue(stats.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import gzip
+import http.client
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.serve import (
+    IMMUTABLE,
+    SiteFiles,
+    SiteServer,
+    etag_matches,
+    parse_accept_encoding,
+)
+
+PAGE = b"<p>" + b"hello world " * 200 + b"</p>"
+
+
+class TestSiteFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "blog").mkdir()
+        (self.root / "index.html").write_bytes(PAGE)
+        (self.root / "index.html.gz").write_bytes(gzip.compress(PAGE))
+        (self.root / "blog" / "index.html").write_bytes(b"<p>blog</p>")
+        (self.root / "index.0123abcd.css").write_bytes(b"body {}")
+        (self.root / "orphan.css.gz").write_bytes(b"")
+        (self.root / "archive.tar.gz").write_bytes(gzip.compress(b"tar"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resolves_directories_to_index(self):
+        site = SiteFiles(self.root).load()
+        self.assertEqual("index.html", site.resolve("/")[0])
+        self.assertEqual("blog/index.html", site.resolve("/blog")[0])
+        self.assertEqual("blog/index.html", site.resolve("/blog/?page=2")[0])
+        self.assertEqual((None, None), site.resolve("/missing"))
+        self.assertEqual((None, None), site.resolve("/../index.html"))
+
+    def test_compressed_files_are_variants(self):
+        site = SiteFiles(self.root).load()
+        self.assertNotIn("index.html.gz", site.files)
+        self.assertEqual(["index.html"], list(site.variants))
+        self.assertEqual("gzip", site.negotiate("index.html", "gzip, deflate")[0])
+        self.assertEqual((None, None), site.negotiate("index.html", "gzip;q=0"))
+
+    def test_compressed_files_without_original_are_served(self):
+        site = SiteFiles(self.root).load()
+        key, entry = site.resolve("/archive.tar.gz")
+        self.assertEqual("archive.tar.gz", key)
+        self.assertEqual(gzip.compress(b"tar"), entry.body)
+        self.assertEqual("application/gzip", entry.content_type)
+        self.assertEqual("orphan.css.gz", site.resolve("/orphan.css.gz")[0])
+        self.assertNotIn("archive.tar", site.variants)
+
+    def test_large_files_stay_on_disk(self):
+        site = SiteFiles(self.root, threshold=100).load()
+        self.assertIsNone(site.files["index.html"].body)
+        self.assertEqual(b"<p>blog</p>", site.files["blog/index.html"].body)
+
+    def test_fingerprinted_files_are_immutable(self):
+        site = SiteFiles(self.root).load()
+        self.assertEqual(IMMUTABLE, site.files["index.0123abcd.css"].cache_control)
+        self.assertNotEqual(IMMUTABLE, site.files["index.html"].cache_control)
+
+    def test_parse_headers(self):
+        self.assertEqual(
+            {"gzip": 1.0, "br": 0.5}, parse_accept_encoding("gzip, br;q=0.5")
+        )
+        self.assertTrue(etag_matches('"a", W/"b"', '"b"'))
+        self.assertTrue(etag_matches("*", '"b"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+
+
+class TestSiteServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "index.html").write_bytes(PAGE)
+        (self.root / "index.html.gz").write_bytes(gzip.compress(PAGE))
+        (self.root / "big.png").write_bytes(bytes(range(256)) * 64)
+        site = SiteFiles(self.root, threshold=1024).load()
+        self.server = SiteServer(("127.0.0.1", 0), site)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.connection = http.client.HTTPConnection(
+            "127.0.0.1", self.server.server_address[1], timeout=5
+        )
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def get(self, path, method="GET", **headers):
+        self.connection.request(method, path, headers=headers)
+        response = self.connection.getresponse()
+        return response, response.read()
+
+    def test_get_and_revalidate(self):
+        response, body = self.get("/")
+        self.assertEqual(200, response.status)
+        self.assertEqual(PAGE, body)
+        self.assertEqual("Accept-Encoding", response.getheader("Vary"))
+        etag = response.getheader("ETag")
+
+        response, body = self.get("/", **{"If-None-Match": etag})
+        self.assertEqual(304, response.status)
+        self.assertEqual(b"", body)
+
+    def test_precompressed_variant(self):
+        response, body = self.get("/index.html", **{"Accept-Encoding": "gzip"})
+        self.assertEqual("gzip", response.getheader("Content-Encoding"))
+        self.assertEqual(PAGE, gzip.decompress(body))
+        self.assertNotEqual(
+            self.get("/index.html")[0].getheader("ETag"), response.getheader("ETag")
+        )
+
+    def test_sendfile_for_large_files(self):
+        response, body = self.get("/big.png")
+        self.assertEqual("image/png", response.getheader("Content-Type"))
+        self.assertEqual(bytes(range(256)) * 64, body)
+        response, body = self.get("/")
+        self.assertEqual(PAGE, body)
+
+    def test_head_and_missing(self):
+        response, body = self.get("/", method="HEAD")
+        self.assertEqual(str(len(PAGE)), response.getheader("Content-Length"))
+        self.assertEqual(b"", body)
+        self.assertEqual(404, self.get("/missing")[0].status)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.template import Template, load_template, rewrite_node_urls
+from src.leafnode import LeafNode
+from src.parentnode import ParentNode
+
+TEMPLATE = """<title>{{ Title }}</title>
+<link href="/index.css" />
+<p>{{Author}}</p>
+<article>{{ Content }}</article>"""
+
+
+class TestTemplate(unittest.TestCase):
+    def test_slots(self):
+        template = Template(TEMPLATE)
+        self.assertEqual(["Title", "Author", "Content"], [s for s, _ in template.slots])
+        self.assertEqual(4, len(template.segments))
+
+    def test_render(self):
+        expected = """<title>Hi</title>
+<link href="/base/index.css" />
+<p>Me</p>
+<article><a href="/">x</a></article>"""
+        template = Template(TEMPLATE, basepath="/base/")
+        result = template.render(
+            {"Title": "Hi", "Author": "Me", "Content": '<a href="/">x</a>'}
+        )
+        self.assertEqual(expected, result)
+
+    def test_write_streams_nodes(self):
+        template = Template(TEMPLATE)
+        values = {
+            "Title": "Hi",
+            "Author": "Me",
+            "Content": ParentNode("div", [LeafNode("b", "bold")]),
+        }
+        stream = io.StringIO()
+        template.write(stream, values)
+        self.assertEqual(template.render(values), stream.getvalue())
+        self.assertIn("<article><div><b>bold</b></div></article>", stream.getvalue())
+
+    def test_minify_applies_to_segments_and_nodes(self):
+        template = Template(TEMPLATE, minify=True)
+        values = {
+            "Title": "Hi",
+            "Author": "Me",
+            "Content": ParentNode("ul", [LeafNode("li", "a"), LeafNode("li", "b")]),
+        }
+        expected = '<title>Hi</title><link href="/index.css"><p>Me</p><article><ul><li>a<li>b</ul></article>'
+        self.assertEqual(expected, template.render(values))
+        stream = io.StringIO()
+        template.write(stream, values)
+        self.assertEqual(expected, stream.getvalue())
+
+    def test_missing_value_keeps_placeholder(self):
+        result = Template("<p>{{ Date }}</p>").render({})
+        self.assertEqual("<p>{{ Date }}</p>", result)
+
+    def test_rewrite_node_urls(self):
+        node = ParentNode(
+            "p",
+            [
+                LeafNode("a", "home", {"href": "/"}),
+                LeafNode("img", "", {"src": "/images/a.png", "alt": "a"}),
+                LeafNode("a", "out", {"href": "https://boot.dev"}),
+            ],
+        )
+        rewrite_node_urls(node, "/base/")
+        expected = '<p><a href="/base/">home</a><img src="/base/images/a.png" alt="a"><a href="https://boot.dev">out</a></p>'
+        self.assertEqual(expected, node.to_html())
+
+    def test_load_template_recompiles_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "template.html"
+            path.write_text("<b>{{ Title }}</b>")
+            first = load_template(path)
+            self.assertIs(first, load_template(path))
+            path.write_text("<i>{{ Title }}</i>")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertEqual("<i>T</i>", load_template(path).render({"Title": "T"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
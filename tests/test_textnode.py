@@ -236,6 +236,53 @@ class TestTextToTextnodes(unittest.TestCase):
         result = text_to_textnodes(text)
         self.assertEqual(expected, result)
 
+    def test_bold_inside_link(self):
+        expected = [
+            TextNode("See ", TextType.TEXT),
+            TextNode(
+                "the **docs**",
+                TextType.LINK,
+                "https://boot.dev",
+                children=[
+                    TextNode("the ", TextType.TEXT),
+                    TextNode("docs", TextType.BOLD),
+                ],
+            ),
+        ]
+        result = text_to_textnodes("See [the **docs**](https://boot.dev)")
+        self.assertEqual(expected, result)
+
+    def test_code_is_not_scanned(self):
+        expected = [
+            TextNode("run ", TextType.TEXT),
+            TextNode("a **b** _c_", TextType.CODE),
+        ]
+        self.assertEqual(expected, text_to_textnodes("run `a **b** _c_`"))
+
+    def test_unclosed_delimiters_are_text(self):
+        expected = [TextNode("2 * 3 = 6 and snake_case [not a link]", TextType.TEXT)]
+        result = text_to_textnodes("2 * 3 = 6 and snake_case [not a link]")
+        self.assertEqual(expected, result)
+
+    def test_unclosed_brackets_before_a_link(self):
+        expected = [
+            TextNode("[a]( ![b [c](", TextType.TEXT),
+            TextNode("d", TextType.LINK, "/e"),
+            TextNode(" (", TextType.TEXT),
+        ]
+        self.assertEqual(expected, text_to_textnodes("[a]( ![b [c]([d](/e) ("))
+
+    def test_nested_link_to_html(self):
+        expected = '<a href="/x">the <b>docs</b></a>'
+        (node,) = text_to_textnodes("[the **docs**](/x)")
+        self.assertEqual(expected, text_node_to_html_node(node).to_html())
+
+    def test_many_spans(self):
+        text = "plain **bold** and _it_ " * 300
+        result = text_to_textnodes(text)
+        self.assertEqual(1201, len(result))
+        self.assertEqual(TextNode("bold", TextType.BOLD), result[1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.utils import (
+    PageGenerationError,
+    create_html_content_from_md,
+    render_page,
+    stream_page,
+)
+
+TEMPLATE = (
+    '<title>{{ Title }}</title><link href="/index.css"><body>{{ Content }}</body>'
+)
+
+
+class TestParallelGeneration(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        for i in range(6):
+            page = self.root / "content" / f"post{i}"
+            page.mkdir(parents=True)
+            (page / "index.md").write_text(
+                f"# Post {i}\n\nSome **bold** text and a [link](/post{i})"
+            )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, dest, jobs):
+        create_html_content_from_md(
+            "/base/", str(self.root / "content"), self.template, dest, jobs=jobs
+        )
+        return {p.relative_to(dest): p.read_bytes() for p in Path(dest).rglob("*.html")}
+
+    def test_parallel_output_matches_serial(self):
+        serial = self.build(str(self.root / "serial"), jobs=1)
+        parallel = self.build(str(self.root / "parallel"), jobs=3)
+        self.assertEqual(6, len(serial))
+        self.assertEqual(serial, parallel)
+
+    def test_errors_name_the_source_file(self):
+        broken = self.root / "content" / "post3" / "index.md"
+        broken.write_text("No title here")
+        for jobs in (1, 3):
+            with self.assertRaises(PageGenerationError) as cm:
+                self.build(str(self.root / f"out{jobs}"), jobs=jobs)
+            self.assertEqual(broken, cm.exception.source)
+
+
+class TestStreamPage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.template = self.root / "template.html"
+        self.template.write_text(TEMPLATE)
+        self.source = self.root / "index.md"
+        self.dest = self.root / "index.html"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertStreamMatches(self, markdown, minify=False):
+        self.source.write_text(markdown)
+        stream_page("/base/", self.source, self.template, self.dest, minify=minify)
+        expected = render_page("/base/", self.source, self.template, minify=minify)
+        self.assertEqual(expected, self.dest.read_text())
+
+    def test_output_matches_buffered_render(self):
+        self.assertStreamMatches(
+            "# Title\n\nSome [link](/a) text\n\n```\ncode\n\nmore\n```\n\n- a\n- b\n"
+        )
+
+    def test_title_after_other_blocks(self):
+        self.assertStreamMatches("Intro paragraph\n\n> quote\n\n# Late title\n\nBody")
+
+    def test_minified_output_matches(self):
+        self.assertStreamMatches("# Title\n\npara one\n\npara two\n\n1. x\n2. y", True)
+
+    def test_missing_title_raises(self):
+        self.source.write_text("No title here")
+        with self.assertRaises(Exception):
+            stream_page("/", self.source, self.template, self.dest)
+
+    def test_leading_rule_matches(self):
+        self.assertStreamMatches("---\nIntro text\n---\n\n# Title\n\nBody")
+        self.assertStreamMatches("---\n\n# Welcome\n\n---\n\nBody")
+
+    def test_front_matter_matches(self):
+        self.template.write_text("{{ Title }} {{ Date }} {{ Tags }} {{ Content }}")
+        self.assertStreamMatches(
+            "---\ntitle: Meta\ndate: 2024-05-01\ntags: [a, b]\n---\nBody only\n"
+        )
+        self.assertTrue(self.dest.read_text().startswith("Meta 2024-05-01 a, b <div>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
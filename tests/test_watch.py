@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.watch import SiteWatcher, diff_snapshots
+
+
+def touch(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestDiffSnapshots(unittest.TestCase):
+    def test_added_changed_removed(self):
+        old = {"a": (1, 1), "b": (1, 1), "c": (1, 1)}
+        new = {"a": (1, 1), "b": (2, 1), "d": (1, 1)}
+        self.assertEqual({"b", "c", "d"}, diff_snapshots(old, new))
+
+
+class TestSiteWatcher(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        touch(self.root / "content" / "index.md", "# Home\n\nHello")
+        touch(self.root / "content" / "blog" / "index.md", "# Blog\n\nPosts")
+        touch(self.root / "static" / "index.css", "body {}")
+        touch(self.root / "template.html", "<h1>{{ Title }}</h1>{{ Content }}")
+        self.watcher = SiteWatcher(
+            "/",
+            self.root / "content",
+            self.root / "static",
+            self.root / "template.html",
+            self.root / "docs",
+        )
+        self.watcher.build()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_build(self):
+        self.assertEqual(2, len(self.watcher.pages))
+        self.assertTrue((self.root / "docs" / "index.css").exists())
+        self.assertIn("<p>Posts</p>", (self.root / "docs/blog/index.html").read_text())
+        self.assertEqual(set(), self.watcher.poll())
+
+    def test_page_change_rebuilds_only_that_page(self):
+        home = self.root / "docs" / "index.html"
+        home.write_text("untouched")
+        touch(self.root / "content" / "blog" / "index.md", "# Blog\n\nNew post")
+        self.assertEqual(1, self.watcher.rebuild(self.watcher.poll()))
+        self.assertIn("New post", (self.root / "docs/blog/index.html").read_text())
+        self.assertEqual("untouched", home.read_text())
+        self.assertEqual(1, len(self.watcher.latencies))
+
+    def test_template_change_refills_every_page(self):
+        touch(self.root / "template.html", "<h2>{{ Title }}</h2>{{ Content }}")
+        self.assertEqual(2, self.watcher.rebuild(self.watcher.poll()))
+        self.assertIn("<h2>Home</h2>", (self.root / "docs/index.html").read_text())
+
+    def test_removed_files_are_pruned(self):
+        (self.root / "content" / "blog" / "index.md").unlink()
+        (self.root / "static" / "index.css").unlink()
+        self.watcher.rebuild(self.watcher.poll())
+        self.assertFalse((self.root / "docs" / "blog").exists())
+        self.assertFalse((self.root / "docs" / "index.css").exists())
+        self.assertEqual(1, len(self.watcher.pages))
+
+
+if __name__ == "__main__":
+    unittest.main()